@@ -72,7 +72,7 @@ func main() {
 			"log_level", config.LogLevel,
 			"cerebras_base_url", config.BaseUrl,
 			"tools_count", len(toolRegistry.GetTools()),
-			"npc_endpoints", "POST /npc/register, POST /npc/act, GET /npc/list, GET /npc/{id}, DELETE /npc/{id}",
+			"npc_endpoints", "POST /npc/register, POST /npc/act, POST /npc/act/batch, GET /npc/list, GET /npc/{id}, DELETE /npc/{id}",
 			"tool_endpoints", "POST /tools/register, GET /tools/session/{id}")
 	} else {
 		logging.Info("Starting LLM NPC Backend server",
@@ -81,7 +81,7 @@ func main() {
 			"log_level", config.LogLevel,
 			"cerebras_base_url", config.BaseUrl,
 			"tools_count", len(toolRegistry.GetTools()),
-			"npc_endpoints", "POST /npc/register, POST /npc/act, GET /npc/list, GET /npc/{id}, DELETE /npc/{id}",
+			"npc_endpoints", "POST /npc/register, POST /npc/act, POST /npc/act/batch, GET /npc/list, GET /npc/{id}, DELETE /npc/{id}",
 			"tool_endpoints", "POST /tools/register, GET /tools/session/{id}")
 	}
 
@@ -96,6 +96,8 @@ func main() {
 
 	// Define the health check handler
 	healthHandler := http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		// Repeats the body as a header so HEAD requests can tell this backend from any other 200
+		w.Header().Set("X-Health", "pong")
 		w.WriteHeader(http.StatusOK)
 		fmt.Fprintf(w, "pong")
 	})
@@ -170,7 +172,7 @@ func main() {
 	))
 
 	http.Handle("/health", api.ApplyDefaultMiddleware(
-		api.WithMethodValidation(healthHandler, "GET"),
+		api.WithMethodValidation(healthHandler, "GET", "HEAD"),
 	))
 
 	http.Handle("/npc", api.ApplyDefaultMiddleware(
@@ -190,6 +192,10 @@ func main() {
 		api.WithMethodValidation(http.HandlerFunc(npcHandlers.ActHandler), "POST"),
 	))
 
+	http.Handle("/npc/act/batch", api.ApplyDefaultMiddleware(
+		api.WithMethodValidation(http.HandlerFunc(npcHandlers.ActBatchHandler), "POST"),
+	))
+
 	http.Handle("/npc/list", api.ApplyDefaultMiddleware(
 		api.WithMethodValidation(http.HandlerFunc(npcHandlers.ListHandler), "GET"),
 	))
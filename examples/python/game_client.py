@@ -6,49 +6,254 @@ This is a contrived example showing how a game engine would integrate
 with the backend to create intelligent NPCs.
 """
 
-import requests
+import gzip
 import json
+import sys
+import threading
 import time
-from typing import Dict, List, Optional
+import types
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; rounds are parsed from the full body without it
+    ijson = None
+
+
+# Bind the JSON codec once so per-tick calls skip the orjson check and attribute lookups
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(payload) -> bytes:
+        """Serialize a request payload to JSON bytes."""
+        return json.dumps(payload).encode("utf-8")
+    
+    _loads = json.loads
+
+
+def _import_httpx():
+    """Import httpx if it is installed with HTTP/2 support, else return None."""
+    try:
+        import h2  # noqa: F401  (required by httpx for HTTP/2)
+        import httpx
+    except ImportError:  # httpx[http2] is optional; requests is used without it
+        return None
+    return httpx
+
+
+def _response_text(response) -> str:
+    """Decode a response body for error messages without charset detection."""
+    # The backend always replies in UTF-8; response.text would guess the charset first
+    return response.content.decode("utf-8", "replace")
+
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Shared read-only defaults so optional arguments and missing keys don't allocate
+_EMPTY_LIST = ()
+_EMPTY_DICT = types.MappingProxyType({})
+
+# Act bodies larger than this are gzip-compressed before sending
+GZIP_MIN_BYTES = 1024
+
+# Most acts the backend accepts in one /npc/act/batch request
+MAX_BATCH_ACTS = 64
+
+
+def _edge_key(edge: Dict) -> Tuple[str, str, str]:
+    """Identify a knowledge graph edge the way the backend's deltas do."""
+    # Several edges may join the same two nodes, so the relationship is part of the key
+    relationship = (edge.get("data") or _EMPTY_DICT).get("relationship")
+    return edge["source"], edge["target"], relationship if isinstance(relationship, str) else ""
+
 
 class NPCBackendClient:
     """Client for communicating with the LLM NPC Backend via HTTP."""
     
-    def __init__(self, base_url: str = "http://localhost:8080"):
+    def __init__(self, base_url: str = "http://localhost:8080", wire_format: str = "json",
+                 http2: bool = False):
+        """
+        Args:
+            base_url: Base URL of the backend server
+            wire_format: "json" (default) or "msgpack". With "msgpack", NPC
+                actions are sent and received as MessagePack, which is
+                smaller than JSON for large surroundings and knowledge graphs.
+                Requires the msgpack package.
+            http2: Use an httpx client with HTTP/2 so concurrent calls share
+                one multiplexed connection. Only takes effect for https://
+                backends (e.g. behind a TLS proxy) and when httpx[http2] is
+                installed; otherwise the requests session is used.
+        """
         self.base_url = base_url
         self.session_id = None
+        self._session_id_json = None  # session_id pre-escaped as a JSON string
         self.npcs = {}  # Store registered NPC IDs
+        self._kg_state = {}  # Last knowledge graph synced per NPC: (version, nodes, edges)
+        self._act_templates = {}  # Static part of each NPC's act payload
+        self._act_serializers = {}  # Pre-encoded JSON act writers per NPC
+        
+        if wire_format not in ("json", "msgpack"):
+            raise ValueError(f"Unsupported wire format: {wire_format}")
+        self.wire_format = wire_format
+        self._msgpack = None
+        if wire_format == "msgpack":
+            import msgpack
+            self._msgpack = msgpack
+        
+        # One pooled session for every call so ticks reuse keep-alive sockets
+        httpx = _import_httpx() if http2 else None
+        self._use_httpx = httpx is not None
+        self._session = self._create_session(httpx)
+        self._json_headers = {"Content-Type": "application/json"}
+        self._session.headers["Accept-Encoding"] = "gzip"
+        if self._msgpack is not None:
+            self._act_headers = {"Content-Type": MSGPACK_CONTENT_TYPE, "Accept": MSGPACK_CONTENT_TYPE}
+        else:
+            self._act_headers = self._json_headers
+        self._act_gzip_headers = dict(self._act_headers, **{"Content-Encoding": "gzip"})
+    
+    def _create_session(self, httpx):
+        """Create the pooled HTTP session shared by every call, on httpx if given."""
+        # The HTTP libraries are imported here rather than at module level:
+        # they dominate import time for scripts that never open a session
+        if httpx is not None:
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+            return httpx.Client(
+                base_url=self.base_url,
+                # No read timeout: multi-round NPC inference can take a while
+                timeout=httpx.Timeout(None, connect=2.0),
+                transport=transport,
+            )
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         
-    def health_check(self) -> bool:
-        """Check if the backend is running."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def _post(self, url: str, body: bytes, headers: Dict[str, str]):
+        """POST an encoded request body with whichever HTTP library backs the session."""
+        # httpx deprecates raw bytes in data=, and requests has no content= argument
+        if self._use_httpx:
+            return self._session.post(url, content=body, headers=headers)
+        return self._session.post(url, data=body, headers=headers)
+    
+    def _encode_act(self, payload):
+        """
+        Serialize an act payload in the configured wire format.
+        
+        Returns the body and the headers to send it with. Large bodies
+        (knowledge graphs, long descriptions) are gzip-compressed.
+        """
+        if self._msgpack is not None:
+            body = self._msgpack.packb(payload, use_bin_type=True)
+        else:
+            body = _dumps(payload)
+        return self._compress_act(body)
+    
+    def _compress_act(self, body: bytes):
+        """Return an encoded act body and its headers, gzip-compressing large bodies."""
+        if len(body) > GZIP_MIN_BYTES:
+            # Level 1 is nearly as fast as a copy and still shrinks repetitive game state a lot
+            return gzip.compress(body, compresslevel=1), self._act_gzip_headers
+        return body, self._act_headers
+    
+    def _decode_act(self, response):
+        """Parse an act response according to its Content-Type."""
+        if MSGPACK_CONTENT_TYPE in response.headers.get("Content-Type", ""):
+            return self._msgpack.unpackb(response.content, raw=False)
+        return _loads(response.content)
+    
+    def _act_error(self, response) -> str:
+        """Extract the error message from a failed act response."""
         try:
-            response = requests.get(f"{self.base_url}/health")
-            return response.text == "pong"
+            return self._decode_act(response).get("error", f"HTTP {response.status_code}")
+        except Exception:
+            return _response_text(response)
+    
+    def close(self):
+        """Close the underlying HTTP session and its connection pool."""
+        self._session.close()
+    
+    def __enter__(self) -> "NPCBackendClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        
+    def health_check(self, warm_connections: int = 0) -> bool:
+        """
+        Check if the backend is running.
+        
+        Args:
+            warm_connections: After a successful check, open this many
+                keep-alive connections with concurrent HEAD requests so that
+                parallel NPC actions (e.g. npc_act_many) start on warm sockets.
+        """
+        try:
+            response = self._session.get(f"{self.base_url}/health")
+            healthy = response.content == b"pong"
         except Exception as e:
             print(f"Health check failed: {e}")
             return False
+        
+        if healthy and warm_connections > 1:
+            self._warm_pool(warm_connections)
+        return healthy
+    
+    def _warm_pool(self, connections: int):
+        """Populate the connection pool with idle keep-alive sockets."""
+        # The health check already left one socket in the pool; the HEADs must
+        # run concurrently or they would all reuse that same socket
+        url = f"{self.base_url}/health"
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            for future in [executor.submit(self._session.head, url) for _ in range(connections)]:
+                try:
+                    future.result()
+                except Exception:
+                    pass  # Warming is best-effort; a failed socket is opened on demand later
     
     def register_tools(self, session_id: str, tools: List[Dict]) -> bool:
         """Register custom game-specific tools for NPCs to use."""
-        self.session_id = session_id
+        # Interned so the ID shared by every act payload compares by pointer
+        self.session_id = sys.intern(session_id)
+        self._session_id_json = _dumps(self.session_id)
+        self._act_templates.clear()  # Templates embed the session ID
+        self._act_serializers.clear()
         
         payload = {
             "session_id": session_id,
             "tools": tools
         }
+        body = _dumps(payload)
         
-        response = requests.post(
-            f"{self.base_url}/tools/register",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
+        response = self._post(f"{self.base_url}/tools/register", body, self._json_headers)
         
         if response.status_code == 201:
-            result = response.json()
+            result = _loads(response.content)
             print(f"✓ Registered {result['tools_count']} tools: {result['tool_names']}")
             return True
         else:
-            print(f"✗ Tool registration failed: {response.text}")
+            print(f"✗ Tool registration failed: {_response_text(response)}")
             return False
     
     def register_npc(self, name: str, background_story: str) -> Optional[str]:
@@ -58,76 +263,401 @@ class NPCBackendClient:
             "background_story": background_story
         }
         
-        response = requests.post(
-            f"{self.base_url}/npc/register",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
+        response = self._post(f"{self.base_url}/npc/register", _dumps(payload), self._json_headers)
         
         if response.status_code == 201:
-            result = response.json()
-            npc_id = result['npc_id']
+            result = _loads(response.content)
+            npc_id = sys.intern(result['npc_id'])
             self.npcs[name] = npc_id
+            self._act_serializer(npc_id)
             print(f"✓ Registered NPC '{name}' with ID: {npc_id}")
             return npc_id
         else:
-            print(f"✗ NPC registration failed: {response.text}")
+            print(f"✗ NPC registration failed: {_response_text(response)}")
             return None
     
     def npc_act(self, npc_id: str, surroundings: List[Dict], 
-                events: List[Dict] = None, knowledge_graph: Dict = None) -> Dict:
-        """Execute a tick/action for an NPC."""
-        payload = {
-            "npc_id": npc_id,
-            "surroundings": surroundings,
-        }
+                events: List[Dict] = _EMPTY_LIST, knowledge_graph: Dict = _EMPTY_DICT,
+                detail: bool = True) -> Dict:
+        """
+        Execute a tick/action for an NPC.
         
-        # Add optional session_id for custom tools
-        if self.session_id:
-            payload["session_id"] = self.session_id
+        With detail=False the backend returns only llm_response and success,
+        skipping the rounds and tool usage, which is cheaper for background
+        NPCs whose tool calls aren't inspected.
+        """
+        if knowledge_graph or self._msgpack is not None:
+            payload, kg_snapshot = self._build_act_payload(npc_id, surroundings, events, knowledge_graph)
+            body, headers = self._encode_act(payload)
+        else:
+            # Without a knowledge graph every tick has the same shape, so only the lists are encoded
+            payload, kg_snapshot = _EMPTY_DICT, None
+            body, headers = self._compress_act(self._act_serializer(npc_id)(surroundings, events))
+        if not detail:
+            headers = dict(headers, **{"X-NPC-Detail": "summary"})
+        response = self._post(f"{self.base_url}/npc/act", body, headers)
+        
+        if response.status_code == 409 and "knowledge_graph_delta" in payload:
+            # The server's copy is stale or gone; resend the full graph
+            self._kg_state.pop(npc_id, None)
+            return self.npc_act(npc_id, surroundings, events, knowledge_graph, detail)
+        
+        if response.status_code == 200:
+            if kg_snapshot is not None:
+                self._kg_state[npc_id] = (payload["kg_version"],) + kg_snapshot
+            return self._decode_act(response)
+        else:
+            error = self._act_error(response)
+            print(f"✗ NPC action failed: {response.status_code} - {error}")
+            return {"success": False, "error": error}
+    
+    def npc_act_rounds(self, npc_id: str, surroundings: List[Dict],
+                       events: List[Dict] = _EMPTY_LIST,
+                       knowledge_graph: Dict = _EMPTY_DICT) -> Iterator[Dict]:
+        """Execute a tick for an NPC and yield each inference round as it is parsed.
+        
+        With ijson installed the response body is streamed and every round is
+        handed out before the rest of the document has arrived. Without it (or
+        when using msgpack or the HTTP/2 transport) the full response is parsed
+        first and its rounds are yielded from memory.
+        """
+        # Only requests exposes the raw body stream; httpx clients have their own stream() API
+        if ijson is None or self._msgpack is not None or self._use_httpx:
+            yield from self.npc_act(npc_id, surroundings, events, knowledge_graph).get("rounds") or ()
+            return
+        
+        payload, kg_snapshot = self._build_act_payload(npc_id, surroundings, events, knowledge_graph)
+        body, headers = self._encode_act(payload)
+        response = self._session.post(
+            f"{self.base_url}/npc/act",
+            data=body,
+            headers=headers,
+            stream=True
+        )
+        
+        with response:
+            if response.status_code == 409 and "knowledge_graph_delta" in payload:
+                # The server's copy is stale or gone; resend the full graph
+                self._kg_state.pop(npc_id, None)
+                yield from self.npc_act_rounds(npc_id, surroundings, events, knowledge_graph)
+                return
+        
+            if response.status_code != 200:
+                print(f"✗ NPC action failed: {response.status_code} - {self._act_error(response)}")
+                return
+        
+            if kg_snapshot is not None:
+                self._kg_state[npc_id] = (payload["kg_version"],) + kg_snapshot
+        
+            # Let urllib3 undo any Content-Encoding before ijson reads the raw stream
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "rounds.item")
+    
+    def _build_act_payload(self, npc_id: str, surroundings: List[Dict],
+                           events: List[Dict], knowledge_graph: Dict) -> Tuple[Dict, Optional[Tuple]]:
+        """Build an act payload and the knowledge graph snapshot to record on success."""
+        # Start from a copy of the NPC's template so only per-tick keys are inserted
+        payload = self._act_template(npc_id).copy()
+        payload["surroundings"] = surroundings
         
         # Add optional events
         if events:
             payload["events"] = events
         
-        # Add optional knowledge graph
+        # Add optional knowledge graph, as a delta once the server has a copy
+        kg_snapshot = None
         if knowledge_graph:
-            payload["knowledge_graph"] = knowledge_graph
+            kg_snapshot = self._knowledge_graph_snapshot(knowledge_graph)
+            payload.update(self._knowledge_graph_fields(npc_id, knowledge_graph, kg_snapshot))
         
-        response = requests.post(
-            f"{self.base_url}/npc/act",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
+        return payload, kg_snapshot
+    
+    def _act_template(self, npc_id: str) -> Dict:
+        """Return the cached static fields (npc_id, session_id) of an NPC's act payload."""
+        template = self._act_templates.get(npc_id)
+        if template is None:
+            template = {"npc_id": npc_id}
+            # Add optional session_id for custom tools
+            if self.session_id:
+                template["session_id"] = self.session_id
+            self._act_templates[npc_id] = template
+        return template
+    
+    def _act_serializer(self, npc_id: str):
+        """
+        Return a function that writes an NPC's JSON act body.
+        
+        The static fields are encoded once into a byte prefix; each call only
+        encodes surroundings and events and splices them in.
+        """
+        serializer = self._act_serializers.get(npc_id)
+        if serializer is None:
+            prefix = b'{"npc_id":' + _dumps(npc_id)
+            if self.session_id:
+                prefix += b',"session_id":' + self._session_id_json
+            prefix += b',"surroundings":'
+            
+            def serializer(surroundings, events):
+                if events:
+                    return b"".join((prefix, _dumps(surroundings), b',"events":', _dumps(events), b"}"))
+                return b"".join((prefix, _dumps(surroundings), b"}"))
+            
+            self._act_serializers[npc_id] = serializer
+        return serializer
+    
+    def _knowledge_graph_snapshot(self, knowledge_graph: Dict):
+        """Fingerprint every node and edge so the next tick can be diffed against it."""
+        nodes = {node["id"]: _dumps(node) for node in knowledge_graph.get("nodes", _EMPTY_LIST)}
+        edges = {_edge_key(edge): _dumps(edge) for edge in knowledge_graph.get("edges", _EMPTY_LIST)}
+        return nodes, edges
+    
+    def _knowledge_graph_fields(self, npc_id: str, knowledge_graph: Dict, snapshot) -> Dict:
+        """Build the knowledge graph fields of an act payload: the full graph or a delta."""
+        if npc_id not in self._kg_state:
+            return {"knowledge_graph": knowledge_graph, "kg_version": 1}
+        
+        version, last_nodes, last_edges = self._kg_state[npc_id]
+        nodes, edges = snapshot
+        delta = {
+            "add_nodes": [
+                node for node in knowledge_graph.get("nodes", _EMPTY_LIST)
+                if last_nodes.get(node["id"]) != nodes[node["id"]]
+            ],
+            "remove_nodes": [node_id for node_id in last_nodes if node_id not in nodes],
+            "add_edges": [
+                edge for edge in knowledge_graph.get("edges", _EMPTY_LIST)
+                if last_edges.get(_edge_key(edge)) != edges[_edge_key(edge)]
+            ],
+            "remove_edges": [
+                {"source": source, "target": target, "relationship": relationship}
+                for source, target, relationship in last_edges
+                if (source, target, relationship) not in edges
+            ],
+        }
+        return {"knowledge_graph_delta": delta, "kg_base_version": version, "kg_version": version + 1}
+    
+    def npc_act_batch(self, calls: List[Dict]) -> List[Dict]:
+        """
+        Execute a tick for several NPCs in one request.
+        
+        Each call is a dict with the same keys as npc_act's arguments
+        (npc_id, surroundings, events, knowledge_graph). Results are
+        returned in the same order as the calls. More than MAX_BATCH_ACTS
+        calls are sent as several requests, since the backend rejects
+        larger batches.
+        """
+        if len(calls) > MAX_BATCH_ACTS:
+            return [
+                result
+                for start in range(0, len(calls), MAX_BATCH_ACTS)
+                for result in self.npc_act_batch(calls[start:start + MAX_BATCH_ACTS])
+            ]
+        
+        acts = []
+        for call in calls:
+            act = {
+                "npc_id": call["npc_id"],
+                "surroundings": call["surroundings"],
+            }
+            if call.get("events"):
+                act["events"] = call["events"]
+            if call.get("knowledge_graph"):
+                act["knowledge_graph"] = call["knowledge_graph"]
+            acts.append(act)
+        
+        payload = {"acts": acts}
+        if self.session_id:
+            payload["session_id"] = self.session_id
+        
+        body, headers = self._encode_act(payload)
+        response = self._post(f"{self.base_url}/npc/act/batch", body, headers)
         
         if response.status_code == 200:
-            return response.json()
+            return self._decode_act(response)["responses"]
         else:
-            print(f"✗ NPC action failed: {response.status_code} - {response.text}")
-            return {"success": False, "error": response.text}
+            error = self._act_error(response)
+            print(f"✗ Batched NPC action failed: {response.status_code} - {error}")
+            return [{"success": False, "error": error} for _ in calls]
+    
+    def npc_act_many(self, calls: List[Dict], max_workers: int = 8) -> List[Dict]:
+        """
+        Execute ticks for several NPCs concurrently, one /npc/act request each.
+        
+        Useful against backends without /npc/act/batch. Each call is a dict of
+        npc_act keyword arguments; results are returned in the same order.
+        The session's connection pool (pool_maxsize=20) covers the default
+        worker count, so every worker keeps its own keep-alive socket.
+        """
+        if not calls:
+            return []
+        
+        results = [None] * len(calls)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+            futures = {pool.submit(self.npc_act, **call): i for i, call in enumerate(calls)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
     
     def list_npcs(self) -> Dict:
         """List all registered NPCs."""
-        response = requests.get(f"{self.base_url}/npc/list")
+        response = self._session.get(f"{self.base_url}/npc/list")
         
         if response.status_code == 200:
-            return response.json()
+            return _loads(response.content)
         else:
-            print(f"✗ Failed to list NPCs: {response.text}")
+            print(f"✗ Failed to list NPCs: {_response_text(response)}")
             return {}
     
     def delete_npc(self, npc_id: str) -> bool:
         """Delete an NPC."""
-        response = requests.delete(f"{self.base_url}/npc/{npc_id}")
+        response = self._session.delete(f"{self.base_url}/npc/{npc_id}")
         
         if response.status_code == 200:
+            self._kg_state.pop(npc_id, None)
+            self._act_templates.pop(npc_id, None)
+            self._act_serializers.pop(npc_id, None)
             print(f"✓ Deleted NPC: {npc_id}")
             return True
         else:
-            print(f"✗ Failed to delete NPC: {response.text}")
+            print(f"✗ Failed to delete NPC: {_response_text(response)}")
             return False
 
 
+class BatchedClient:
+    """
+    Coalesces npc_act calls that arrive close together into one batch request.
+    
+    A background thread waits until no new call has arrived for window_ms, or
+    until max_wait_ms has passed since the first queued call, and then sends
+    everything queued via npc_act_batch. Each call returns a Future that
+    resolves to that NPC's result.
+    """
+    
+    def __init__(self, client: NPCBackendClient, window_ms: float = 50, max_wait_ms: float = 200):
+        self.client = client
+        self.window = window_ms / 1000.0
+        self.max_wait = max_wait_ms / 1000.0
+        self._cond = threading.Condition()
+        self._pending = []
+        self._first_at = 0.0  # When the oldest pending call was queued
+        self._last_at = 0.0  # When the newest pending call was queued
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="npc-act-batcher", daemon=True)
+        self._worker.start()
+    
+    def npc_act(self, npc_id: str, surroundings: List[Dict],
+                events: List[Dict] = _EMPTY_LIST, knowledge_graph: Dict = _EMPTY_DICT) -> Future:
+        """Queue a tick for an NPC and return a Future for its result."""
+        future = Future()
+        call = {
+            "npc_id": npc_id,
+            "surroundings": surroundings,
+            "events": events,
+            "knowledge_graph": knowledge_graph,
+        }
+        
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchedClient is closed")
+            if not self._pending:
+                self._first_at = now
+            self._last_at = now
+            self._pending.append((call, future))
+            self._cond.notify()
+        
+        return future
+    
+    def flush(self):
+        """Send all pending calls now as a single batch."""
+        with self._cond:
+            pending, self._pending = self._pending, []
+        self._send(pending)
+    
+    def close(self):
+        """Send any pending calls and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._worker.join()
+        self.flush()
+    
+    def __enter__(self) -> "BatchedClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _run(self):
+        """Wait for each batch's idle or max-wait deadline, then send it."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                
+                # Every new call pushes the idle deadline back, up to the max-wait cap
+                while self._pending and not self._closed:
+                    deadline = min(self._last_at + self.window, self._first_at + self.max_wait)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                
+                pending, self._pending = self._pending, []
+            
+            self._send(pending)
+    
+    def _send(self, pending):
+        """Send queued calls as one batch and resolve their futures."""
+        # Drop calls whose futures were cancelled while queued; the rest can
+        # no longer be cancelled, so resolving them below cannot fail
+        pending = [(call, future) for call, future in pending if future.set_running_or_notify_cancel()]
+        if not pending:
+            return
+        
+        try:
+            results = self.client.npc_act_batch([call for call, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(pending, results):
+            future.set_result(result)
+
+
+def print_act_result(result: Dict, label: str = "Response", verbose: bool = True):
+    """Print an NPC's response, inference rounds, and tool usage."""
+    if result.get('success'):
+        response_text = result.get('llm_response', '').strip()
+        if response_text:
+            print(f"{label}: {response_text}\n")
+        else:
+            print(f"{label}: (empty - NPC may have only used tools or model produced no output)\n")
+        
+        if verbose:
+            print(f"Inference rounds: {len(result.get('rounds', _EMPTY_LIST))}")
+        
+        # Check if NPC used any tools
+        for round_num, round_data in enumerate(result.get('rounds', _EMPTY_LIST), 1):
+            tools_used = round_data.get('tools_used', _EMPTY_LIST)
+            if tools_used:
+                print(f"Round {round_num} - Tools used:")
+                for tool in tools_used:
+                    print(f"  - {tool['tool_name']}: {tool.get('args') or {}}")
+                    if verbose and tool.get('success'):
+                        print(f"    → {tool.get('response', 'Success')}")
+        
+        # Show helpful message if everything is empty
+        if not response_text and not any(round_data.get('tools_used') for round_data in result.get('rounds', _EMPTY_LIST)):
+            print("⚠️  Note: LLM produced no output. This can happen with small models like qwen3:1.7b.")
+            print("    Try using a larger model (llama3:8b, mistral:7b) for better results.")
+    else:
+        print(f"✗ Error: {result.get('error') or result.get('error_message', 'Unknown error')}")
+
+
 def main():
     """Example game scenario demonstrating backend usage."""
     print("=== LLM NPC Backend - Example Game Client ===\n")
@@ -137,8 +667,12 @@ def main():
     print("   For better results, use: ollama pull llama3:8b\n")
     
     # Initialize client
-    client = NPCBackendClient()
-    
+    with NPCBackendClient() as client:
+        run_scenario(client)
+
+
+def run_scenario(client: NPCBackendClient):
+    """Run the example scenario against a connected client."""
     # 1. Health check
     print("1. Checking backend health...")
     if not client.health_check():
@@ -224,7 +758,6 @@ def main():
     print("5. Simulating game scenario: 'Suspicious Stranger at the Inn'\n")
     
     # Turn 1: Innkeeper notices a hooded stranger
-    print("--- TURN 1: Innkeeper's Perspective ---")
     innkeeper_surroundings = [
         {
             "name": "Tavern Common Room",
@@ -251,37 +784,7 @@ def main():
         }
     ]
     
-    result = client.npc_act(innkeeper_id, innkeeper_surroundings, innkeeper_events)
-    
-    if result.get('success'):
-        response_text = result.get('llm_response', '').strip()
-        if response_text:
-            print(f"Response: {response_text}\n")
-        else:
-            print("Response: (empty - NPC may have only used tools or model produced no output)\n")
-        
-        print(f"Inference rounds: {len(result.get('rounds', []))}")
-        
-        # Check if NPC used any tools
-        for round_num, round_data in enumerate(result.get('rounds', []), 1):
-            tools_used = round_data.get('tools_used', [])
-            if tools_used:
-                print(f"Round {round_num} - Tools used:")
-                for tool in tools_used:
-                    print(f"  - {tool['tool_name']}: {tool.get('args', {})}")
-                    if tool.get('success'):
-                        print(f"    → {tool.get('response', 'Success')}")
-        
-        # Show helpful message if everything is empty
-        if not response_text and not any(round_data.get('tools_used') for round_data in result.get('rounds', [])):
-            print("⚠️  Note: LLM produced no output. This can happen with small models like qwen3:1.7b.")
-            print("    Try using a larger model (llama3:8b, mistral:7b) for better results.")
-    else:
-        print(f"✗ Error: {result.get('error', 'Unknown error')}")
-    print()
-    
     # Turn 2: Guard's perspective on the same situation
-    print("--- TURN 2: Guard's Perspective ---")
     guard_surroundings = [
         {
             "name": "The Gilded Swan Tavern",
@@ -304,34 +807,16 @@ def main():
         }
     ]
     
-    result = client.npc_act(guard_id, guard_surroundings, guard_events)
+    # Both NPCs act on the same tick, so send them as one batch
+    results = client.npc_act_batch([
+        {"npc_id": innkeeper_id, "surroundings": innkeeper_surroundings, "events": innkeeper_events},
+        {"npc_id": guard_id, "surroundings": guard_surroundings, "events": guard_events},
+    ])
     
-    if result.get('success'):
-        response_text = result.get('llm_response', '').strip()
-        if response_text:
-            print(f"Response: {response_text}\n")
-        else:
-            print("Response: (empty - NPC may have only used tools or model produced no output)\n")
-        
-        print(f"Inference rounds: {len(result.get('rounds', []))}")
-        
-        # Check if NPC used any tools
-        for round_num, round_data in enumerate(result.get('rounds', []), 1):
-            tools_used = round_data.get('tools_used', [])
-            if tools_used:
-                print(f"Round {round_num} - Tools used:")
-                for tool in tools_used:
-                    print(f"  - {tool['tool_name']}: {tool.get('args', {})}")
-                    if tool.get('success'):
-                        print(f"    → {tool.get('response', 'Success')}")
-        
-        # Show helpful message if everything is empty
-        if not response_text and not any(round_data.get('tools_used') for round_data in result.get('rounds', [])):
-            print("⚠️  Note: LLM produced no output. This can happen with small models like qwen3:1.7b.")
-            print("    Try using a larger model (llama3:8b, mistral:7b) for better results.")
-    else:
-        print(f"✗ Error: {result.get('error', 'Unknown error')}")
-    print()
+    for heading, result in zip(("TURN 1: Innkeeper's Perspective", "TURN 2: Guard's Perspective"), results):
+        print(f"--- {heading} ---")
+        print_act_result(result)
+        print()
     
     # 6. Demonstrate multi-round thinking with knowledge graph
     print("6. Testing NPC with knowledge graph (memory)...")
@@ -363,27 +848,7 @@ def main():
         knowledge_graph
     )
     
-    if result.get('success'):
-        response_text = result.get('llm_response', '').strip()
-        if response_text:
-            print(f"Response with KG: {response_text}\n")
-        else:
-            print("Response with KG: (empty - NPC may have only used tools or model produced no output)\n")
-        
-        # Check for tools
-        for round_num, round_data in enumerate(result.get('rounds', []), 1):
-            tools_used = round_data.get('tools_used', [])
-            if tools_used:
-                print(f"Round {round_num} - Tools used:")
-                for tool in tools_used:
-                    print(f"  - {tool['tool_name']}: {tool.get('args', {})}")
-        
-        # Show helpful message if everything is empty
-        if not response_text and not any(round_data.get('tools_used') for round_data in result.get('rounds', [])):
-            print("⚠️  Note: LLM produced no output. This can happen with small models like qwen3:1.7b.")
-            print("    Try using a larger model (llama3:8b, mistral:7b) for better results.")
-    else:
-        print(f"✗ Error: {result.get('error', 'Unknown error')}")
+    print_act_result(result, label="Response with KG", verbose=False)
     
     print("\n=== Example Complete ===")
 
@@ -0,0 +1,178 @@
+"""Tests for the example game client, run against a local stub backend."""
+
+import gzip
+import json
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+import game_client
+from game_client import BatchedClient, NPCBackendClient
+
+
+ACT_RESPONSE = {
+    "success": True,
+    "llm_response": "Halt!",
+    "rounds": [
+        {"round_number": 1, "tools_used": [{"tool_name": "speak", "args": {"message": "Halt!"}, "success": True}]},
+        {"round_number": 2, "tools_used": []},
+    ],
+}
+
+
+class _StubBackend(BaseHTTPRequestHandler):
+    """
+    Answers every POST with ACT_RESPONSE and records the request bodies.
+    
+    Batches get one response per act, and 413 beyond the backend's limit.
+    """
+    
+    requests = []
+    
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        payload = json.loads(body)
+        self.requests.append((self.path, payload))
+        status, reply = 200, ACT_RESPONSE
+        if self.path == "/npc/act/batch":
+            if len(payload["acts"]) > 64:
+                status, reply = 413, {"error": "too many acts"}
+            else:
+                reply = {"responses": [dict(ACT_RESPONSE, npc_id=act["npc_id"]) for act in payload["acts"]]}
+        reply = json.dumps(reply).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def backend_url():
+    _StubBackend.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubBackend)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_npc_act_rounds_streams_with_requests_session(backend_url, monkeypatch):
+    pytest.importorskip("ijson")
+    
+    def no_fallback(*args, **kwargs):
+        raise AssertionError("npc_act_rounds fell back to parsing the full body")
+    
+    with NPCBackendClient(backend_url) as client:
+        monkeypatch.setattr(client, "npc_act", no_fallback)
+        rounds = list(client.npc_act_rounds("npc-1", [{"name": "Gate", "description": "A town gate"}]))
+    
+    assert [r["round_number"] for r in rounds] == [1, 2]
+    assert rounds[0]["tools_used"][0]["tool_name"] == "speak"
+    assert _StubBackend.requests[0][0] == "/npc/act"
+
+
+def test_npc_act_rounds_without_ijson_parses_full_body(backend_url, monkeypatch):
+    monkeypatch.setattr(game_client, "ijson", None)
+    
+    with NPCBackendClient(backend_url) as client:
+        rounds = list(client.npc_act_rounds("npc-1", [{"name": "Gate", "description": "A town gate"}]))
+    
+    assert [r["round_number"] for r in rounds] == [1, 2]
+
+
+def test_npc_act_over_httpx_sends_content_without_deprecation(backend_url):
+    pytest.importorskip("h2")
+    pytest.importorskip("httpx")
+    
+    with NPCBackendClient(backend_url, http2=True) as client:
+        assert client._use_httpx
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            result = client.npc_act("npc-1", [{"name": "Gate", "description": "A town gate"}])
+    
+    assert result["llm_response"] == "Halt!"
+    assert _StubBackend.requests[0] == ("/npc/act", {
+        "npc_id": "npc-1",
+        "surroundings": [{"name": "Gate", "description": "A town gate"}],
+    })
+
+
+def test_npc_act_batch_splits_batches_over_backend_limit(backend_url):
+    calls = [{"npc_id": f"npc-{i}", "surroundings": []} for i in range(65)]
+    
+    with NPCBackendClient(backend_url) as client:
+        results = client.npc_act_batch(calls)
+    
+    assert [len(payload["acts"]) for _, payload in _StubBackend.requests] == [64, 1]
+    assert [result["npc_id"] for result in results] == [call["npc_id"] for call in calls]
+
+
+def test_register_tools_sends_tools_changed_in_place(backend_url):
+    tools = [{"name": "speak", "description": "Say something", "parameters": {}}]
+    
+    with NPCBackendClient(backend_url) as client:
+        client.register_tools("game", tools)
+        tools.append({"name": "wave", "description": "Wave at someone", "parameters": {}})
+        client.register_tools("game", tools)
+    
+    sent = [[tool["name"] for tool in payload["tools"]] for _, payload in _StubBackend.requests]
+    assert sent == [["speak"], ["speak", "wave"]]
+
+
+class _RecordingClient:
+    """Stands in for NPCBackendClient, answering every batch call successfully."""
+    
+    def __init__(self):
+        self.batches = []
+    
+    def npc_act_batch(self, calls):
+        self.batches.append([call["npc_id"] for call in calls])
+        return [{"success": True, "npc_id": call["npc_id"]} for call in calls]
+
+
+def test_batched_client_skips_cancelled_futures():
+    client = _RecordingClient()
+    
+    with BatchedClient(client, window_ms=10_000, max_wait_ms=10_000) as batcher:
+        cancelled = batcher.npc_act("npc-1", [])
+        kept = batcher.npc_act("npc-2", [])
+        assert cancelled.cancel()
+        batcher.flush()
+        
+        # The batcher still resolves calls queued after the cancellation
+        later = batcher.npc_act("npc-3", [])
+        batcher.flush()
+    
+    assert kept.result(timeout=1) == {"success": True, "npc_id": "npc-2"}
+    assert later.result(timeout=1) == {"success": True, "npc_id": "npc-3"}
+    assert client.batches == [["npc-2"], ["npc-3"]]
+
+
+def test_knowledge_graph_delta_tells_parallel_edges_apart():
+    def graph(*relationships):
+        return {
+            "nodes": [{"id": "a"}, {"id": "b"}],
+            "edges": [{"source": "a", "target": "b", "data": {"relationship": r}} for r in relationships],
+        }
+    
+    with NPCBackendClient("http://127.0.0.1:9") as client:
+        first = graph("employs", "suspects")
+        client._kg_state["npc-1"] = (1,) + client._knowledge_graph_snapshot(first)
+        
+        second = graph("fired", "suspects")
+        fields = client._knowledge_graph_fields("npc-1", second, client._knowledge_graph_snapshot(second))
+    
+    delta = fields["knowledge_graph_delta"]
+    assert delta["add_edges"] == [{"source": "a", "target": "b", "data": {"relationship": "fired"}}]
+    assert delta["remove_edges"] == [{"source": "a", "target": "b", "relationship": "employs"}]
@@ -27,6 +27,7 @@ const (
 	ErrCodeServiceUnavailable = "SERVICE_UNAVAILABLE"
 	ErrCodeNotFound           = "NOT_FOUND"
 	ErrCodeBadRequest         = "BAD_REQUEST"
+	ErrCodeConflict           = "CONFLICT"
 	
 	// LLM-specific error codes
 	ErrCodeLLMProviderUnavailable = "LLM_PROVIDER_UNAVAILABLE"
@@ -42,6 +43,7 @@ var statusToErrorCode = map[int]string{
 	http.StatusBadRequest:           ErrCodeBadRequest,
 	http.StatusNotFound:             ErrCodeNotFound,
 	http.StatusMethodNotAllowed:     ErrCodeMethodNotAllowed,
+	http.StatusConflict:             ErrCodeConflict,
 	http.StatusUnsupportedMediaType: ErrCodeUnsupportedMedia,
 	http.StatusTooManyRequests:      ErrCodeRateLimit,
 	http.StatusInternalServerError:  ErrCodeInternalServer,
@@ -2,6 +2,8 @@ package api
 
 import (
 	"bufio"
+	"bytes"
+	"compress/gzip"
 	"context"
 	"encoding/json"
 	"errors"
@@ -205,6 +207,59 @@ func ValidationMiddleware(allowedMethods []string, requireJSON bool) func(http.H
 	}
 }
 
+// Size limits for gzip request bodies, before and after decompression.
+// Requests over either limit are rejected with 413 Request Entity Too Large.
+var (
+	MaxGzipRequestBytes         int64 = 10 << 20
+	MaxDecompressedRequestBytes int64 = 50 << 20
+)
+
+// GzipRequestMiddleware decompresses request bodies sent with Content-Encoding: gzip
+func GzipRequestMiddleware(next http.Handler) http.Handler {
+	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if !strings.EqualFold(r.Header.Get("Content-Encoding"), "gzip") {
+			next.ServeHTTP(w, r)
+			return
+		}
+
+		r.Body = http.MaxBytesReader(w, r.Body, MaxGzipRequestBytes)
+		zr, err := gzip.NewReader(r.Body)
+		if err != nil {
+			writeGzipBodyError(w, r, err)
+			return
+		}
+		defer zr.Close()
+
+		// Read one byte past the limit so an oversized body can be told apart
+		body, err := io.ReadAll(io.LimitReader(zr, MaxDecompressedRequestBytes+1))
+		if err != nil {
+			writeGzipBodyError(w, r, err)
+			return
+		}
+		if int64(len(body)) > MaxDecompressedRequestBytes {
+			WriteErrorResponse(w, http.StatusRequestEntityTooLarge, "Decompressed request body too large", ErrCodeBadRequest, nil, r.Context())
+			return
+		}
+
+		// Replace the body with the decompressed content
+		r.Body = io.NopCloser(bytes.NewReader(body))
+		r.ContentLength = int64(len(body))
+		r.Header.Del("Content-Encoding")
+
+		next.ServeHTTP(w, r)
+	})
+}
+
+// writeGzipBodyError reports a gzip request body that could not be read
+func writeGzipBodyError(w http.ResponseWriter, r *http.Request, err error) {
+	var maxBytesErr *http.MaxBytesError
+	if errors.As(err, &maxBytesErr) {
+		WriteErrorResponse(w, http.StatusRequestEntityTooLarge, "Request body too large", ErrCodeBadRequest, nil, r.Context())
+		return
+	}
+	WriteErrorResponse(w, http.StatusBadRequest, "Invalid gzip request body", ErrCodeBadRequest, nil, r.Context())
+}
+
 // ErrorHandlingMiddleware provides standardized error handling utilities
 func ErrorHandlingMiddleware(next http.Handler) http.Handler {
 	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
@@ -295,5 +350,7 @@ func ApplyDefaultMiddleware(handler http.Handler) http.Handler {
 		RequestTracingMiddleware,
 		PanicRecoveryMiddleware,
 		ErrorHandlingMiddleware,
+		GzipRequestMiddleware,
+		MsgpackMiddleware,
 	)
 }
@@ -1,9 +1,12 @@
 package api
 
 import (
+	"bytes"
+	"compress/gzip"
 	"encoding/json"
 	"fmt"
 	"io"
+	"math/rand"
 	"net/http"
 	"net/http/httptest"
 	"strings"
@@ -195,6 +198,98 @@ func TestValidationMiddleware_ContentType(t *testing.T) {
 	}
 }
 
+// TestGzipRequestMiddleware tests that gzip request bodies are decompressed
+func TestGzipRequestMiddleware(t *testing.T) {
+	var receivedBody string
+	var receivedEncoding string
+	handler := GzipRequestMiddleware(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		body, _ := io.ReadAll(r.Body)
+		receivedBody = string(body)
+		receivedEncoding = r.Header.Get("Content-Encoding")
+		w.WriteHeader(http.StatusOK)
+	}))
+
+	var compressed bytes.Buffer
+	zw := gzip.NewWriter(&compressed)
+	zw.Write([]byte(`{"npc_id":"abc"}`))
+	zw.Close()
+
+	req := httptest.NewRequest("POST", "/test", &compressed)
+	req.Header.Set("Content-Encoding", "gzip")
+	rec := httptest.NewRecorder()
+
+	handler.ServeHTTP(rec, req)
+
+	if rec.Code != http.StatusOK {
+		t.Errorf("Expected status code %d, got %d", http.StatusOK, rec.Code)
+	}
+	if receivedBody != `{"npc_id":"abc"}` {
+		t.Errorf("Expected decompressed body, got %q", receivedBody)
+	}
+	if receivedEncoding != "" {
+		t.Errorf("Expected Content-Encoding to be removed, got %q", receivedEncoding)
+	}
+
+	// A body that is not valid gzip should be rejected
+	req = httptest.NewRequest("POST", "/test", strings.NewReader("not gzip"))
+	req.Header.Set("Content-Encoding", "gzip")
+	rec = httptest.NewRecorder()
+
+	handler.ServeHTTP(rec, req)
+
+	if rec.Code != http.StatusBadRequest {
+		t.Errorf("Expected status code %d for invalid gzip, got %d", http.StatusBadRequest, rec.Code)
+	}
+}
+
+// TestGzipRequestMiddlewareLimits tests that oversized gzip request bodies are rejected
+func TestGzipRequestMiddlewareLimits(t *testing.T) {
+	defer func(compressed, decompressed int64) {
+		MaxGzipRequestBytes, MaxDecompressedRequestBytes = compressed, decompressed
+	}(MaxGzipRequestBytes, MaxDecompressedRequestBytes)
+	MaxGzipRequestBytes, MaxDecompressedRequestBytes = 512, 1024
+
+	handler := GzipRequestMiddleware(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.WriteHeader(http.StatusOK)
+	}))
+
+	gzipBody := func(data []byte) *bytes.Buffer {
+		var compressed bytes.Buffer
+		zw := gzip.NewWriter(&compressed)
+		zw.Write(data)
+		zw.Close()
+		return &compressed
+	}
+
+	// Random bytes do not compress, so their gzip form is over the compressed limit
+	noise := make([]byte, 1024)
+	rand.New(rand.NewSource(1)).Read(noise)
+
+	tests := []struct {
+		name     string
+		body     *bytes.Buffer
+		expected int
+	}{
+		{"within limits", gzipBody(bytes.Repeat([]byte("a"), 1024)), http.StatusOK},
+		{"decompressed too large", gzipBody(bytes.Repeat([]byte("a"), 1025)), http.StatusRequestEntityTooLarge},
+		{"compressed too large", gzipBody(noise), http.StatusRequestEntityTooLarge},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			req := httptest.NewRequest("POST", "/test", tt.body)
+			req.Header.Set("Content-Encoding", "gzip")
+			rec := httptest.NewRecorder()
+
+			handler.ServeHTTP(rec, req)
+
+			if rec.Code != tt.expected {
+				t.Errorf("Expected status code %d, got %d", tt.expected, rec.Code)
+			}
+		})
+	}
+}
+
 // TestChainMiddleware tests middleware chaining functionality
 func TestChainMiddleware(t *testing.T) {
 	executionOrder := []string{}
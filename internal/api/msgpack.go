@@ -0,0 +1,422 @@
+package api
+
+import (
+	"bytes"
+	"encoding/binary"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"math"
+	"net/http"
+	"strings"
+
+	"github.com/piercegov/llm-npc-backend/internal/logging"
+)
+
+// MsgpackContentType is the media type used for MessagePack request and response bodies
+const MsgpackContentType = "application/msgpack"
+
+// msgpackMaxDepth bounds how deeply arrays and maps may nest, as encoding/json
+// does, so a crafted body cannot exhaust the stack of the recursive decoder
+const msgpackMaxDepth = 10000
+
+var (
+	errMsgpackTruncated = errors.New("msgpack: unexpected end of data")
+	errMsgpackTooDeep   = errors.New("msgpack: exceeded max nesting depth")
+)
+
+// MsgpackToJSON transcodes a MessagePack document into JSON.
+// Only the types that can be represented in JSON are supported; binary
+// values are converted to strings and map keys must be strings.
+func MsgpackToJSON(data []byte) ([]byte, error) {
+	d := &msgpackDecoder{buf: data}
+	v, err := d.decode()
+	if err != nil {
+		return nil, err
+	}
+	if d.pos != len(d.buf) {
+		return nil, fmt.Errorf("msgpack: %d trailing bytes", len(d.buf)-d.pos)
+	}
+	return json.Marshal(v)
+}
+
+// JSONToMsgpack transcodes a JSON document into MessagePack.
+func JSONToMsgpack(data []byte) ([]byte, error) {
+	dec := json.NewDecoder(bytes.NewReader(data))
+	dec.UseNumber()
+
+	var v interface{}
+	if err := dec.Decode(&v); err != nil {
+		return nil, err
+	}
+
+	var buf bytes.Buffer
+	if err := encodeMsgpack(&buf, v); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
+type msgpackDecoder struct {
+	buf   []byte
+	pos   int
+	depth int
+}
+
+func (d *msgpackDecoder) next(n int) ([]byte, error) {
+	if n < 0 || d.pos+n > len(d.buf) {
+		return nil, errMsgpackTruncated
+	}
+	b := d.buf[d.pos : d.pos+n]
+	d.pos += n
+	return b, nil
+}
+
+func (d *msgpackDecoder) uint(n int) (uint64, error) {
+	b, err := d.next(n)
+	if err != nil {
+		return 0, err
+	}
+	switch n {
+	case 1:
+		return uint64(b[0]), nil
+	case 2:
+		return uint64(binary.BigEndian.Uint16(b)), nil
+	case 4:
+		return uint64(binary.BigEndian.Uint32(b)), nil
+	default:
+		return binary.BigEndian.Uint64(b), nil
+	}
+}
+
+func (d *msgpackDecoder) decode() (interface{}, error) {
+	b, err := d.next(1)
+	if err != nil {
+		return nil, err
+	}
+	c := b[0]
+
+	switch {
+	case c <= 0x7f:
+		return int64(c), nil
+	case c >= 0xe0:
+		return int64(int8(c)), nil
+	case c >= 0x80 && c <= 0x8f:
+		return d.decodeMap(int(c & 0x0f))
+	case c >= 0x90 && c <= 0x9f:
+		return d.decodeArray(int(c & 0x0f))
+	case c >= 0xa0 && c <= 0xbf:
+		return d.decodeString(int(c & 0x1f))
+	}
+
+	switch c {
+	case 0xc0:
+		return nil, nil
+	case 0xc2:
+		return false, nil
+	case 0xc3:
+		return true, nil
+	case 0xc4, 0xd9:
+		return d.decodeSizedString(1)
+	case 0xc5, 0xda:
+		return d.decodeSizedString(2)
+	case 0xc6, 0xdb:
+		return d.decodeSizedString(4)
+	case 0xca:
+		n, err := d.uint(4)
+		return float64(math.Float32frombits(uint32(n))), err
+	case 0xcb:
+		n, err := d.uint(8)
+		return math.Float64frombits(n), err
+	case 0xcc:
+		return d.uint(1)
+	case 0xcd:
+		return d.uint(2)
+	case 0xce:
+		return d.uint(4)
+	case 0xcf:
+		return d.uint(8)
+	case 0xd0:
+		n, err := d.uint(1)
+		return int64(int8(n)), err
+	case 0xd1:
+		n, err := d.uint(2)
+		return int64(int16(n)), err
+	case 0xd2:
+		n, err := d.uint(4)
+		return int64(int32(n)), err
+	case 0xd3:
+		n, err := d.uint(8)
+		return int64(n), err
+	case 0xdc:
+		n, err := d.uint(2)
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeArray(int(n))
+	case 0xdd:
+		n, err := d.uint(4)
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeArray(int(n))
+	case 0xde:
+		n, err := d.uint(2)
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeMap(int(n))
+	case 0xdf:
+		n, err := d.uint(4)
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeMap(int(n))
+	}
+
+	return nil, fmt.Errorf("msgpack: unsupported type byte 0x%02x", c)
+}
+
+func (d *msgpackDecoder) decodeSizedString(sizeBytes int) (interface{}, error) {
+	n, err := d.uint(sizeBytes)
+	if err != nil {
+		return nil, err
+	}
+	return d.decodeString(int(n))
+}
+
+func (d *msgpackDecoder) decodeString(n int) (interface{}, error) {
+	b, err := d.next(n)
+	if err != nil {
+		return nil, err
+	}
+	return string(b), nil
+}
+
+// enter records one more level of nesting, failing past msgpackMaxDepth
+func (d *msgpackDecoder) enter() error {
+	d.depth++
+	if d.depth > msgpackMaxDepth {
+		return errMsgpackTooDeep
+	}
+	return nil
+}
+
+func (d *msgpackDecoder) decodeArray(n int) (interface{}, error) {
+	if n > len(d.buf)-d.pos {
+		return nil, errMsgpackTruncated
+	}
+	if err := d.enter(); err != nil {
+		return nil, err
+	}
+	defer func() { d.depth-- }()
+	arr := make([]interface{}, n)
+	for i := range arr {
+		v, err := d.decode()
+		if err != nil {
+			return nil, err
+		}
+		arr[i] = v
+	}
+	return arr, nil
+}
+
+func (d *msgpackDecoder) decodeMap(n int) (interface{}, error) {
+	if n > len(d.buf)-d.pos {
+		return nil, errMsgpackTruncated
+	}
+	if err := d.enter(); err != nil {
+		return nil, err
+	}
+	defer func() { d.depth-- }()
+	m := make(map[string]interface{}, n)
+	for i := 0; i < n; i++ {
+		k, err := d.decode()
+		if err != nil {
+			return nil, err
+		}
+		key, ok := k.(string)
+		if !ok {
+			return nil, fmt.Errorf("msgpack: map key must be a string, got %T", k)
+		}
+		v, err := d.decode()
+		if err != nil {
+			return nil, err
+		}
+		m[key] = v
+	}
+	return m, nil
+}
+
+func encodeMsgpack(buf *bytes.Buffer, v interface{}) error {
+	switch val := v.(type) {
+	case nil:
+		buf.WriteByte(0xc0)
+	case bool:
+		if val {
+			buf.WriteByte(0xc3)
+		} else {
+			buf.WriteByte(0xc2)
+		}
+	case json.Number:
+		if i, err := val.Int64(); err == nil {
+			encodeMsgpackInt(buf, i)
+			return nil
+		}
+		f, err := val.Float64()
+		if err != nil {
+			return err
+		}
+		buf.WriteByte(0xcb)
+		binary.Write(buf, binary.BigEndian, math.Float64bits(f))
+	case string:
+		n := len(val)
+		switch {
+		case n <= 31:
+			buf.WriteByte(0xa0 | byte(n))
+		case n <= math.MaxUint8:
+			buf.WriteByte(0xd9)
+			buf.WriteByte(byte(n))
+		case n <= math.MaxUint16:
+			buf.WriteByte(0xda)
+			binary.Write(buf, binary.BigEndian, uint16(n))
+		default:
+			buf.WriteByte(0xdb)
+			binary.Write(buf, binary.BigEndian, uint32(n))
+		}
+		buf.WriteString(val)
+	case []interface{}:
+		n := len(val)
+		switch {
+		case n <= 15:
+			buf.WriteByte(0x90 | byte(n))
+		case n <= math.MaxUint16:
+			buf.WriteByte(0xdc)
+			binary.Write(buf, binary.BigEndian, uint16(n))
+		default:
+			buf.WriteByte(0xdd)
+			binary.Write(buf, binary.BigEndian, uint32(n))
+		}
+		for _, item := range val {
+			if err := encodeMsgpack(buf, item); err != nil {
+				return err
+			}
+		}
+	case map[string]interface{}:
+		n := len(val)
+		switch {
+		case n <= 15:
+			buf.WriteByte(0x80 | byte(n))
+		case n <= math.MaxUint16:
+			buf.WriteByte(0xde)
+			binary.Write(buf, binary.BigEndian, uint16(n))
+		default:
+			buf.WriteByte(0xdf)
+			binary.Write(buf, binary.BigEndian, uint32(n))
+		}
+		for key, item := range val {
+			if err := encodeMsgpack(buf, key); err != nil {
+				return err
+			}
+			if err := encodeMsgpack(buf, item); err != nil {
+				return err
+			}
+		}
+	default:
+		return fmt.Errorf("msgpack: unsupported value type %T", v)
+	}
+	return nil
+}
+
+func encodeMsgpackInt(buf *bytes.Buffer, i int64) {
+	switch {
+	case i >= 0 && i <= 0x7f:
+		buf.WriteByte(byte(i))
+	case i < 0 && i >= -32:
+		buf.WriteByte(byte(int8(i)))
+	case i >= math.MinInt8 && i <= math.MaxInt8:
+		buf.WriteByte(0xd0)
+		buf.WriteByte(byte(int8(i)))
+	case i >= math.MinInt16 && i <= math.MaxInt16:
+		buf.WriteByte(0xd1)
+		binary.Write(buf, binary.BigEndian, int16(i))
+	case i >= math.MinInt32 && i <= math.MaxInt32:
+		buf.WriteByte(0xd2)
+		binary.Write(buf, binary.BigEndian, int32(i))
+	default:
+		buf.WriteByte(0xd3)
+		binary.Write(buf, binary.BigEndian, i)
+	}
+}
+
+// MsgpackMiddleware lets clients exchange MessagePack instead of JSON.
+// Requests sent with Content-Type application/msgpack are transcoded to JSON
+// before reaching the handler, and JSON responses are transcoded back to
+// MessagePack when the client lists application/msgpack in its Accept header.
+func MsgpackMiddleware(next http.Handler) http.Handler {
+	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if strings.Contains(r.Header.Get("Content-Type"), MsgpackContentType) {
+			// Capped like compressed gzip bodies, since the middleware runs on every endpoint
+			body, err := io.ReadAll(http.MaxBytesReader(w, r.Body, MaxGzipRequestBytes))
+			if err != nil {
+				var maxBytesErr *http.MaxBytesError
+				if errors.As(err, &maxBytesErr) {
+					WriteErrorResponse(w, http.StatusRequestEntityTooLarge, "Request body too large", ErrCodeBadRequest, nil, r.Context())
+					return
+				}
+				WriteErrorResponse(w, http.StatusBadRequest, "Error reading request body", ErrCodeBadRequest, nil, r.Context())
+				return
+			}
+
+			jsonBody, err := MsgpackToJSON(body)
+			if err != nil {
+				WriteErrorResponse(w, http.StatusBadRequest, fmt.Sprintf("Invalid msgpack: %s", err.Error()), ErrCodeBadRequest, nil, r.Context())
+				return
+			}
+
+			r.Body = io.NopCloser(bytes.NewReader(jsonBody))
+			r.ContentLength = int64(len(jsonBody))
+			r.Header.Set("Content-Type", "application/json")
+		}
+
+		if !strings.Contains(r.Header.Get("Accept"), MsgpackContentType) {
+			next.ServeHTTP(w, r)
+			return
+		}
+
+		bw := &bufferedResponseWriter{ResponseWriter: w, statusCode: http.StatusOK}
+		next.ServeHTTP(bw, r)
+
+		body := bw.body.Bytes()
+		if strings.Contains(w.Header().Get("Content-Type"), "application/json") {
+			if packed, err := JSONToMsgpack(body); err == nil {
+				body = packed
+				w.Header().Set("Content-Type", MsgpackContentType)
+			} else {
+				logging.Warn("Failed to transcode response to msgpack", "error", err, "request_id", GetRequestID(r.Context()))
+			}
+		}
+
+		w.Header().Del("Content-Length")
+		w.WriteHeader(bw.statusCode)
+		w.Write(body)
+	})
+}
+
+// bufferedResponseWriter holds back the status code and body so the response can be rewritten
+type bufferedResponseWriter struct {
+	http.ResponseWriter
+	statusCode int
+	body       bytes.Buffer
+}
+
+// WriteHeader records the status code without sending it
+func (w *bufferedResponseWriter) WriteHeader(statusCode int) {
+	w.statusCode = statusCode
+}
+
+// Write buffers the response body
+func (w *bufferedResponseWriter) Write(b []byte) (int, error) {
+	return w.body.Write(b)
+}
@@ -0,0 +1,134 @@
+package api
+
+import (
+	"bytes"
+	"encoding/json"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"reflect"
+	"testing"
+)
+
+// TestMsgpackRoundTrip tests that JSON documents survive a trip through msgpack
+func TestMsgpackRoundTrip(t *testing.T) {
+	tests := []string{
+		`{"npc_id":"abc","count":3,"ratio":0.5,"ok":true,"missing":null}`,
+		`{"nested":{"list":[1,-1,-200,70000,"x",false]},"empty":[]}`,
+		`{"big":-9000000000,"text":"` + string(bytes.Repeat([]byte("a"), 300)) + `"}`,
+	}
+
+	for _, doc := range tests {
+		packed, err := JSONToMsgpack([]byte(doc))
+		if err != nil {
+			t.Fatalf("JSONToMsgpack(%s) failed: %v", doc, err)
+		}
+
+		unpacked, err := MsgpackToJSON(packed)
+		if err != nil {
+			t.Fatalf("MsgpackToJSON failed for %s: %v", doc, err)
+		}
+
+		var want, got interface{}
+		json.Unmarshal([]byte(doc), &want)
+		json.Unmarshal(unpacked, &got)
+		if !reflect.DeepEqual(want, got) {
+			t.Errorf("Round trip mismatch: want %v, got %v", want, got)
+		}
+	}
+}
+
+// TestMsgpackToJSON_Truncated tests that truncated input is rejected
+func TestMsgpackToJSON_Truncated(t *testing.T) {
+	// fixmap with one entry whose value is missing
+	if _, err := MsgpackToJSON([]byte{0x81, 0xa1, 'a'}); err == nil {
+		t.Error("Expected an error for truncated msgpack input")
+	}
+}
+
+// TestMsgpackToJSON_TooDeep tests that deeply nested input is rejected instead of exhausting the stack
+func TestMsgpackToJSON_TooDeep(t *testing.T) {
+	// One-element arrays nested far past the depth limit, ending in nil
+	data := append(bytes.Repeat([]byte{0x91}, msgpackMaxDepth+1), 0xc0)
+	if _, err := MsgpackToJSON(data); err != errMsgpackTooDeep {
+		t.Errorf("Expected errMsgpackTooDeep, got %v", err)
+	}
+
+	// Nesting right at the limit is still accepted
+	data = append(bytes.Repeat([]byte{0x91}, msgpackMaxDepth), 0xc0)
+	if _, err := MsgpackToJSON(data); err != nil {
+		t.Errorf("Expected nesting at the limit to decode, got %v", err)
+	}
+}
+
+// TestMsgpackMiddleware_TooLarge tests that oversized msgpack bodies are rejected
+func TestMsgpackMiddleware_TooLarge(t *testing.T) {
+	defer func(limit int64) { MaxGzipRequestBytes = limit }(MaxGzipRequestBytes)
+	MaxGzipRequestBytes = 16
+
+	handler := MsgpackMiddleware(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		t.Error("Handler should not be called for an oversized body")
+	}))
+
+	packed, err := JSONToMsgpack([]byte(`{"name":"Elara the wandering bard"}`))
+	if err != nil {
+		t.Fatalf("JSONToMsgpack failed: %v", err)
+	}
+
+	req := httptest.NewRequest("POST", "/test", bytes.NewReader(packed))
+	req.Header.Set("Content-Type", MsgpackContentType)
+	rec := httptest.NewRecorder()
+
+	handler.ServeHTTP(rec, req)
+
+	if rec.Code != http.StatusRequestEntityTooLarge {
+		t.Errorf("Expected status code %d, got %d", http.StatusRequestEntityTooLarge, rec.Code)
+	}
+}
+
+// TestMsgpackMiddleware tests request and response transcoding
+func TestMsgpackMiddleware(t *testing.T) {
+	var receivedBody string
+	var receivedType string
+	handler := MsgpackMiddleware(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		body, _ := io.ReadAll(r.Body)
+		receivedBody = string(body)
+		receivedType = r.Header.Get("Content-Type")
+
+		w.Header().Set("Content-Type", "application/json")
+		w.WriteHeader(http.StatusCreated)
+		w.Write([]byte(`{"success":true}`))
+	}))
+
+	packed, err := JSONToMsgpack([]byte(`{"name":"Elara"}`))
+	if err != nil {
+		t.Fatalf("JSONToMsgpack failed: %v", err)
+	}
+
+	req := httptest.NewRequest("POST", "/test", bytes.NewReader(packed))
+	req.Header.Set("Content-Type", MsgpackContentType)
+	req.Header.Set("Accept", MsgpackContentType)
+	rec := httptest.NewRecorder()
+
+	handler.ServeHTTP(rec, req)
+
+	if receivedType != "application/json" || receivedBody != `{"name":"Elara"}` {
+		t.Errorf("Handler received %q (%s), expected JSON body", receivedBody, receivedType)
+	}
+
+	if rec.Code != http.StatusCreated {
+		t.Errorf("Expected status code %d, got %d", http.StatusCreated, rec.Code)
+	}
+
+	if ct := rec.Header().Get("Content-Type"); ct != MsgpackContentType {
+		t.Errorf("Expected Content-Type %s, got %s", MsgpackContentType, ct)
+	}
+
+	unpacked, err := MsgpackToJSON(rec.Body.Bytes())
+	if err != nil {
+		t.Fatalf("Response was not valid msgpack: %v", err)
+	}
+	if string(unpacked) != `{"success":true}` {
+		t.Errorf("Expected {\"success\":true}, got %s", unpacked)
+	}
+}
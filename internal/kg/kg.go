@@ -16,3 +16,67 @@ type Edge struct {
 	Target string                 `json:"target"`
 	Data   map[string]interface{} `json:"data"`
 }
+
+// EdgeKey identifies an edge by its endpoints and its relationship, so that
+// several edges between the same two nodes are told apart
+type EdgeKey struct {
+	Source       string `json:"source"`
+	Target       string `json:"target"`
+	Relationship string `json:"relationship,omitempty"`
+}
+
+// Key returns the identity of the edge used by deltas. The relationship is
+// read from Data["relationship"] and is empty when unset.
+func (e Edge) Key() EdgeKey {
+	relationship, _ := e.Data["relationship"].(string)
+	return EdgeKey{Source: e.Source, Target: e.Target, Relationship: relationship}
+}
+
+// Delta describes the changes between two versions of a knowledge graph.
+// Added nodes and edges replace any existing node with the same ID or edge
+// with the same key (source, target and relationship).
+type Delta struct {
+	AddNodes    []Node    `json:"add_nodes,omitempty"`
+	RemoveNodes []string  `json:"remove_nodes,omitempty"`
+	AddEdges    []Edge    `json:"add_edges,omitempty"`
+	RemoveEdges []EdgeKey `json:"remove_edges,omitempty"`
+}
+
+// Apply returns a new knowledge graph with the delta applied. The receiver is not modified.
+func (g KnowledgeGraph) Apply(d Delta) KnowledgeGraph {
+	dropNodes := make(map[string]bool, len(d.RemoveNodes)+len(d.AddNodes))
+	for _, id := range d.RemoveNodes {
+		dropNodes[id] = true
+	}
+	for _, node := range d.AddNodes {
+		dropNodes[node.ID] = true
+	}
+
+	dropEdges := make(map[EdgeKey]bool, len(d.RemoveEdges)+len(d.AddEdges))
+	for _, key := range d.RemoveEdges {
+		dropEdges[key] = true
+	}
+	for _, edge := range d.AddEdges {
+		dropEdges[edge.Key()] = true
+	}
+
+	result := KnowledgeGraph{
+		Nodes: make([]Node, 0, len(g.Nodes)+len(d.AddNodes)),
+		Edges: make([]Edge, 0, len(g.Edges)+len(d.AddEdges)),
+	}
+	for _, node := range g.Nodes {
+		if !dropNodes[node.ID] {
+			result.Nodes = append(result.Nodes, node)
+		}
+	}
+	result.Nodes = append(result.Nodes, d.AddNodes...)
+
+	for _, edge := range g.Edges {
+		if !dropEdges[edge.Key()] {
+			result.Edges = append(result.Edges, edge)
+		}
+	}
+	result.Edges = append(result.Edges, d.AddEdges...)
+
+	return result
+}
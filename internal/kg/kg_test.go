@@ -0,0 +1,67 @@
+package kg
+
+import "testing"
+
+func TestApplyDelta(t *testing.T) {
+	graph := KnowledgeGraph{
+		Nodes: []Node{
+			{ID: "a", Data: map[string]interface{}{"name": "A"}},
+			{ID: "b", Data: map[string]interface{}{"name": "B"}},
+		},
+		Edges: []Edge{
+			{Source: "a", Target: "b", Data: map[string]interface{}{"relationship": "knows"}},
+		},
+	}
+
+	updated := graph.Apply(Delta{
+		AddNodes:    []Node{{ID: "a", Data: map[string]interface{}{"name": "A2"}}, {ID: "c"}},
+		RemoveNodes: []string{"b"},
+		AddEdges:    []Edge{{Source: "a", Target: "c"}},
+		RemoveEdges: []EdgeKey{{Source: "a", Target: "b", Relationship: "knows"}},
+	})
+
+	if len(graph.Nodes) != 2 || len(graph.Edges) != 1 {
+		t.Errorf("Apply modified the original graph: %+v", graph)
+	}
+
+	if len(updated.Nodes) != 2 || updated.Nodes[0].ID != "a" || updated.Nodes[1].ID != "c" {
+		t.Fatalf("Unexpected nodes after delta: %+v", updated.Nodes)
+	}
+	if updated.Nodes[0].Data["name"] != "A2" {
+		t.Errorf("Expected node a to be replaced, got %+v", updated.Nodes[0])
+	}
+
+	if len(updated.Edges) != 1 || updated.Edges[0].Source != "a" || updated.Edges[0].Target != "c" {
+		t.Errorf("Unexpected edges after delta: %+v", updated.Edges)
+	}
+}
+
+func TestApplyDeltaKeepsParallelEdges(t *testing.T) {
+	graph := KnowledgeGraph{
+		Edges: []Edge{
+			{Source: "a", Target: "b", Data: map[string]interface{}{"relationship": "employs"}},
+			{Source: "a", Target: "b", Data: map[string]interface{}{"relationship": "suspects"}},
+		},
+	}
+
+	updated := graph.Apply(Delta{
+		AddEdges:    []Edge{{Source: "a", Target: "b", Data: map[string]interface{}{"relationship": "fired"}}},
+		RemoveEdges: []EdgeKey{{Source: "a", Target: "b", Relationship: "employs"}},
+	})
+
+	relationships := make([]string, len(updated.Edges))
+	for i, edge := range updated.Edges {
+		relationships[i] = edge.Key().Relationship
+	}
+	if len(relationships) != 2 || relationships[0] != "suspects" || relationships[1] != "fired" {
+		t.Errorf("Expected [suspects fired], got %v", relationships)
+	}
+
+	// Re-adding an edge with an existing key replaces only that edge
+	updated = updated.Apply(Delta{
+		AddEdges: []Edge{{Source: "a", Target: "b", Data: map[string]interface{}{"relationship": "suspects", "since": "today"}}},
+	})
+	if len(updated.Edges) != 2 || updated.Edges[1].Data["since"] != "today" {
+		t.Errorf("Expected the suspects edge to be replaced, got %+v", updated.Edges)
+	}
+}
@@ -2,8 +2,10 @@ package npc
 
 import (
 	"encoding/json"
+	"fmt"
 	"net/http"
 	"strings"
+	"sync"
 
 	"github.com/piercegov/llm-npc-backend/internal/api"
 	"github.com/piercegov/llm-npc-backend/internal/logging"
@@ -88,23 +90,15 @@ func (h *NPCHandlers) ActHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	// Set the tool registry in the input
-	// If session ID is provided, combine global and session tools
-	if req.SessionID != "" && h.sessionManager != nil {
-		sessionTools, err := h.sessionManager.GetSessionTools(req.SessionID)
-		if err != nil {
-			// Log but don't fail - just use global tools
-			logging.Warn("Failed to get session tools", "session_id", req.SessionID, "error", err)
-			req.NPCTickInput.ToolRegistry = h.toolRegistry
-		} else {
-			// Create combined registry with both global and session tools
-			combinedRegistry := tools.NewCombinedToolRegistry(h.toolRegistry, sessionTools)
-			req.NPCTickInput.ToolRegistry = combinedRegistry
-		}
-	} else {
-		req.NPCTickInput.ToolRegistry = h.toolRegistry
+	// Rebuild the knowledge graph from a delta if one was sent
+	if err := h.syncKnowledgeGraph(&req); err != nil {
+		api.WriteErrorResponse(w, http.StatusConflict, "Knowledge graph version mismatch, resend the full graph", api.ErrCodeConflict, nil, r.Context())
+		return
 	}
 
+	// Set the tool registry in the input
+	req.NPCTickInput.ToolRegistry = h.resolveToolRegistry(req.SessionID)
+
 	// Execute the tick
 	result := npc.ActForTick(req.NPCTickInput)
 
@@ -138,16 +132,140 @@ func (h *NPCHandlers) ActHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	response := NPCActResponse{
+	// Callers that don't inspect tool usage can skip the rounds
+	var response interface{} = NPCActResponse{
 		NPCID:         req.NPCID,
 		NPCTickResult: result,
 	}
+	if r.Header.Get(DetailHeader) == DetailSummary {
+		response = NPCActSummaryResponse{
+			NPCID:       req.NPCID,
+			LLMResponse: result.LLMResponse,
+			Success:     result.Success,
+		}
+	}
 
 	w.Header().Set("Content-Type", "application/json")
 	w.WriteHeader(http.StatusOK)
 	json.NewEncoder(w).Encode(response)
 }
 
+// ActBatchHandler handles POST /npc/act/batch
+// Acts in the batch are executed concurrently, at most MaxBatchConcurrency at
+// a time, and their results are returned in request order. A failing act does not fail the whole batch;
+// its entry carries success=false and an error_message instead.
+func (h *NPCHandlers) ActBatchHandler(w http.ResponseWriter, r *http.Request) {
+	var req NPCActBatchRequest
+
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		api.WriteErrorResponse(w, http.StatusBadRequest, "Invalid JSON", api.ErrCodeInvalidJSON, nil, r.Context())
+		return
+	}
+
+	if len(req.Acts) == 0 {
+		api.WriteErrorResponse(w, http.StatusBadRequest, "At least one act is required", api.ErrCodeValidation, nil, r.Context())
+		return
+	}
+
+	if len(req.Acts) > MaxBatchActs {
+		api.WriteErrorResponse(w, http.StatusRequestEntityTooLarge, fmt.Sprintf("At most %d acts are allowed per batch", MaxBatchActs), api.ErrCodeValidation, nil, r.Context())
+		return
+	}
+
+	responses := make([]NPCActResponse, len(req.Acts))
+	var wg sync.WaitGroup
+	sem := make(chan struct{}, MaxBatchConcurrency)
+
+	for i, act := range req.Acts {
+		responses[i].NPCID = act.NPCID
+
+		if act.NPCID == "" {
+			responses[i].NPCTickResult = NPCTickResult{Success: false, ErrorMessage: "NPC ID is required"}
+			continue
+		}
+
+		npc, err := h.storage.Get(act.NPCID)
+		if err != nil {
+			responses[i].NPCTickResult = NPCTickResult{Success: false, ErrorMessage: "NPC not found"}
+			continue
+		}
+
+		if err := h.syncKnowledgeGraph(&act); err != nil {
+			responses[i].NPCTickResult = NPCTickResult{Success: false, ErrorMessage: "Knowledge graph version mismatch"}
+			continue
+		}
+
+		// Acts inherit the batch-level session unless they name their own
+		sessionID := act.SessionID
+		if sessionID == "" {
+			sessionID = req.SessionID
+		}
+		act.NPCTickInput.ToolRegistry = h.resolveToolRegistry(sessionID)
+
+		// Wait for a free slot so a large batch cannot start every inference at once
+		sem <- struct{}{}
+		wg.Add(1)
+		go func(i int, npc *NPC, input NPCTickInput) {
+			defer func() {
+				<-sem
+				wg.Done()
+			}()
+			responses[i].NPCTickResult = npc.ActForTick(input)
+		}(i, npc, act.NPCTickInput)
+	}
+
+	wg.Wait()
+
+	logging.Info("NPC batch act completed", "count", len(responses))
+
+	response := NPCActBatchResponse{
+		Responses: responses,
+		Success:   true,
+		Count:     len(responses),
+	}
+
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(http.StatusOK)
+	json.NewEncoder(w).Encode(response)
+}
+
+// syncKnowledgeGraph keeps the stored knowledge graph for an NPC up to date.
+// Deltas are applied to the stored graph and the result replaces the request's
+// knowledge graph; versioned full graphs are stored for later deltas.
+func (h *NPCHandlers) syncKnowledgeGraph(req *NPCActRequest) error {
+	if req.KnowledgeGraphDelta != nil {
+		graph, err := h.storage.ApplyKnowledgeGraphDelta(req.NPCID, req.KGBaseVersion, req.KGVersion, *req.KnowledgeGraphDelta)
+		if err != nil {
+			return err
+		}
+		req.NPCTickInput.KnowledgeGraph = graph
+		return nil
+	}
+
+	if req.KGVersion > 0 {
+		h.storage.SetKnowledgeGraph(req.NPCID, req.NPCTickInput.KnowledgeGraph, req.KGVersion)
+	}
+	return nil
+}
+
+// resolveToolRegistry returns the tools available to an NPC for the given session.
+// If a session ID is provided, global and session tools are combined.
+func (h *NPCHandlers) resolveToolRegistry(sessionID string) tools.ToolProvider {
+	if sessionID == "" || h.sessionManager == nil {
+		return h.toolRegistry
+	}
+
+	sessionTools, err := h.sessionManager.GetSessionTools(sessionID)
+	if err != nil {
+		// Log but don't fail - just use global tools
+		logging.Warn("Failed to get session tools", "session_id", sessionID, "error", err)
+		return h.toolRegistry
+	}
+
+	// Create combined registry with both global and session tools
+	return tools.NewCombinedToolRegistry(h.toolRegistry, sessionTools)
+}
+
 // ListHandler handles GET /npc/list
 func (h *NPCHandlers) ListHandler(w http.ResponseWriter, r *http.Request) {
 	npcs := h.storage.List()
@@ -0,0 +1,72 @@
+package npc
+
+import (
+	"encoding/json"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+
+	"github.com/piercegov/llm-npc-backend/internal/tools"
+)
+
+func TestActBatchHandlerRequiresActs(t *testing.T) {
+	handlers := NewNPCHandlers(NewNPCStorage(), tools.NewToolRegistry(), nil)
+
+	req := httptest.NewRequest("POST", "/npc/act/batch", strings.NewReader(`{"acts":[]}`))
+	rec := httptest.NewRecorder()
+	handlers.ActBatchHandler(rec, req)
+
+	if rec.Code != http.StatusBadRequest {
+		t.Errorf("Expected status code %d, got %d", http.StatusBadRequest, rec.Code)
+	}
+}
+
+func TestActBatchHandlerReportsPerActErrors(t *testing.T) {
+	handlers := NewNPCHandlers(NewNPCStorage(), tools.NewToolRegistry(), nil)
+
+	body := `{"acts":[{"npc_id":"missing-npc","surroundings":[]},{"surroundings":[]}]}`
+	req := httptest.NewRequest("POST", "/npc/act/batch", strings.NewReader(body))
+	rec := httptest.NewRecorder()
+	handlers.ActBatchHandler(rec, req)
+
+	if rec.Code != http.StatusOK {
+		t.Fatalf("Expected status code %d, got %d", http.StatusOK, rec.Code)
+	}
+
+	var resp NPCActBatchResponse
+	if err := json.NewDecoder(rec.Body).Decode(&resp); err != nil {
+		t.Fatalf("Could not decode response body: %v", err)
+	}
+
+	if resp.Count != 2 || len(resp.Responses) != 2 {
+		t.Fatalf("Expected 2 responses, got count=%d len=%d", resp.Count, len(resp.Responses))
+	}
+	if resp.Responses[0].NPCID != "missing-npc" || resp.Responses[0].Success {
+		t.Errorf("Expected failed response for missing-npc, got %+v", resp.Responses[0])
+	}
+	if resp.Responses[0].ErrorMessage != "NPC not found" {
+		t.Errorf("Expected 'NPC not found', got %q", resp.Responses[0].ErrorMessage)
+	}
+	if resp.Responses[1].Success || resp.Responses[1].ErrorMessage != "NPC ID is required" {
+		t.Errorf("Expected 'NPC ID is required', got %+v", resp.Responses[1])
+	}
+}
+
+func TestActBatchHandlerRejectsOversizedBatch(t *testing.T) {
+	handlers := NewNPCHandlers(NewNPCStorage(), tools.NewToolRegistry(), nil)
+
+	acts := make([]string, MaxBatchActs+1)
+	for i := range acts {
+		acts[i] = fmt.Sprintf(`{"npc_id":"npc-%d","surroundings":[]}`, i)
+	}
+	body := `{"acts":[` + strings.Join(acts, ",") + `]}`
+	req := httptest.NewRequest("POST", "/npc/act/batch", strings.NewReader(body))
+	rec := httptest.NewRecorder()
+	handlers.ActBatchHandler(rec, req)
+
+	if rec.Code != http.StatusRequestEntityTooLarge {
+		t.Errorf("Expected status code %d, got %d", http.StatusRequestEntityTooLarge, rec.Code)
+	}
+}
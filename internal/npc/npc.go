@@ -33,6 +33,13 @@ type NPCActRequest struct {
 	NPCID     string `json:"npc_id" binding:"required"`
 	SessionID string `json:"session_id,omitempty"` // Optional: for custom tools
 	NPCTickInput
+
+	// Optional: incremental knowledge graph sync. A request with KGVersion > 0 and a
+	// full knowledge_graph stores it on the server; later requests can send only a
+	// KnowledgeGraphDelta against KGBaseVersion instead of the whole graph.
+	KnowledgeGraphDelta *kg.Delta `json:"knowledge_graph_delta,omitempty"`
+	KGVersion           int       `json:"kg_version,omitempty"`
+	KGBaseVersion       int       `json:"kg_base_version,omitempty"`
 }
 
 // NPCActResponse represents the response from an NPC action
@@ -41,6 +48,39 @@ type NPCActResponse struct {
 	NPCTickResult
 }
 
+// DetailHeader lets /npc/act callers ask for a summary response with DetailSummary
+const (
+	DetailHeader  = "X-NPC-Detail"
+	DetailSummary = "summary"
+)
+
+// NPCActSummaryResponse is the /npc/act response when only the outcome is requested
+type NPCActSummaryResponse struct {
+	NPCID       string `json:"npc_id"`
+	LLMResponse string `json:"llm_response"`
+	Success     bool   `json:"success"`
+}
+
+// Limits for /npc/act/batch: the most acts accepted in one request, and how
+// many of them run inference at the same time
+const (
+	MaxBatchActs        = 64
+	MaxBatchConcurrency = 8
+)
+
+// NPCActBatchRequest represents the request to make several NPCs act in one call
+type NPCActBatchRequest struct {
+	SessionID string          `json:"session_id,omitempty"` // Optional: default session for every act
+	Acts      []NPCActRequest `json:"acts"`
+}
+
+// NPCActBatchResponse represents the response from a batched NPC action
+type NPCActBatchResponse struct {
+	Responses []NPCActResponse `json:"responses"`
+	Success   bool             `json:"success"`
+	Count     int              `json:"count"`
+}
+
 // NPCListResponse represents the response from listing NPCs
 type NPCListResponse struct {
 	NPCs    map[string]NPCInfo `json:"npcs"`
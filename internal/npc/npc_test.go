@@ -66,3 +66,30 @@ func TestParseKnowledgeGraph(t *testing.T) {
 		t.Errorf("Expected empty knowledge graph %s, got %s", expectedEmpty, knowledgeGraphStringEmpty)
 	}
 }
+
+func TestApplyKnowledgeGraphDeltaVersioning(t *testing.T) {
+	storage := NewNPCStorage()
+	npcID, _ := storage.Register("Elara", "An innkeeper")
+
+	delta := kg.Delta{AddNodes: []kg.Node{{ID: "stranger"}}}
+
+	// No graph has been synced yet
+	if _, err := storage.ApplyKnowledgeGraphDelta(npcID, 1, 2, delta); err != ErrKnowledgeGraphVersionMismatch {
+		t.Errorf("Expected version mismatch before first sync, got %v", err)
+	}
+
+	storage.SetKnowledgeGraph(npcID, kg.KnowledgeGraph{Nodes: []kg.Node{{ID: "guard"}}}, 1)
+
+	graph, err := storage.ApplyKnowledgeGraphDelta(npcID, 1, 2, delta)
+	if err != nil {
+		t.Fatalf("Error applying delta: %v", err)
+	}
+	if len(graph.Nodes) != 2 {
+		t.Errorf("Expected 2 nodes after delta, got %d", len(graph.Nodes))
+	}
+
+	// The same delta against a stale version must be rejected
+	if _, err := storage.ApplyKnowledgeGraphDelta(npcID, 1, 2, delta); err != ErrKnowledgeGraphVersionMismatch {
+		t.Errorf("Expected version mismatch for stale base version, got %v", err)
+	}
+}
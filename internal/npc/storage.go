@@ -1,22 +1,36 @@
 package npc
 
 import (
+	"errors"
 	"fmt"
 	"sync"
 
 	"github.com/google/uuid"
+	"github.com/piercegov/llm-npc-backend/internal/kg"
 )
 
+// ErrKnowledgeGraphVersionMismatch is returned when a knowledge graph delta
+// does not apply to the version stored for an NPC
+var ErrKnowledgeGraphVersionMismatch = errors.New("knowledge graph version mismatch")
+
 // NPCStorage provides thread-safe in-memory storage for NPCs
 type NPCStorage struct {
-	npcs map[string]*NPC
-	mu   sync.RWMutex
+	npcs            map[string]*NPC
+	knowledgeGraphs map[string]versionedKnowledgeGraph
+	mu              sync.RWMutex
+}
+
+// versionedKnowledgeGraph is the last knowledge graph a client synced for an NPC
+type versionedKnowledgeGraph struct {
+	graph   kg.KnowledgeGraph
+	version int
 }
 
 // NewNPCStorage creates a new NPC storage instance
 func NewNPCStorage() *NPCStorage {
 	return &NPCStorage{
-		npcs: make(map[string]*NPC),
+		npcs:            make(map[string]*NPC),
+		knowledgeGraphs: make(map[string]versionedKnowledgeGraph),
 	}
 }
 
@@ -77,9 +91,35 @@ func (s *NPCStorage) Delete(id string) error {
 	}
 
 	delete(s.npcs, id)
+	delete(s.knowledgeGraphs, id)
 	return nil
 }
 
+// SetKnowledgeGraph stores the full knowledge graph for an NPC at the given version
+func (s *NPCStorage) SetKnowledgeGraph(id string, graph kg.KnowledgeGraph, version int) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	s.knowledgeGraphs[id] = versionedKnowledgeGraph{graph: graph, version: version}
+}
+
+// ApplyKnowledgeGraphDelta applies a delta to the stored knowledge graph for an NPC.
+// The delta must be based on the stored version; the result is stored as newVersion.
+func (s *NPCStorage) ApplyKnowledgeGraphDelta(id string, baseVersion, newVersion int, delta kg.Delta) (kg.KnowledgeGraph, error) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	current, exists := s.knowledgeGraphs[id]
+	if !exists || current.version != baseVersion {
+		return kg.KnowledgeGraph{}, ErrKnowledgeGraphVersionMismatch
+	}
+
+	graph := current.graph.Apply(delta)
+	s.knowledgeGraphs[id] = versionedKnowledgeGraph{graph: graph, version: newVersion}
+
+	return graph, nil
+}
+
 // Count returns the number of registered NPCs
 func (s *NPCStorage) Count() int {
 	s.mu.RLock()
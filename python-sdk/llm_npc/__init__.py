@@ -22,6 +22,7 @@ Basic usage:
 __version__ = "0.1.0"
 
 from .client import NPCClient, Session, NPC
+from .async_client import AsyncNPCClient, AsyncSession, AsyncNPC
 from .decorators import tool
 from .context import Surroundings, Event, ContextBuilder, KnowledgeGraph
 from .models import Response, ToolCall, Round, Surrounding, Event as EventModel
@@ -39,6 +40,9 @@ __all__ = [
     "NPCClient",
     "Session",
     "NPC",
+    "AsyncNPCClient",
+    "AsyncSession",
+    "AsyncNPC",
     
     # Decorators
     "tool",
@@ -0,0 +1,20 @@
+"""JSON encoding used by the SDK, backed by orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    def dumps(value: Any) -> bytes:
+        """Encode a value as JSON bytes."""
+        return json.dumps(value).encode("utf-8")
+    
+    loads = json.loads
@@ -0,0 +1,377 @@
+"""Asynchronous client for communicating with the LLM NPC Backend."""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ._json import dumps, loads
+from .client import NPC, Session, _HEALTH_HEADER, _MAX_BATCH_ACTS, _PARSE_ERRORS, _import_httpx
+from .models import Response, Surrounding
+from .context import Surroundings, Event, ContextBuilder, KnowledgeGraph
+from .exceptions import BackendConnectionError, BackendError, ToolRegistrationError
+
+
+class AsyncNPCClient:
+    """
+    Asynchronous client for interacting with the LLM NPC Backend.
+    
+    Every call is a coroutine, so the actions of many NPCs can run
+    concurrently over one pooled (and, over HTTPS, HTTP/2 multiplexed)
+    connection. Requires the ``async`` extra: ``pip install "llm-npc[async]"``.
+    
+    Usage:
+        async with AsyncNPCClient("http://localhost:8080") as client:
+            session = client.session("my-game-session")
+            guard = await session.create_npc("Guard", "A vigilant guard")
+            merchant = await session.create_npc("Merchant", "A travelling merchant")
+            
+            responses = await asyncio.gather(
+                guard.act(surroundings=["Town gate"]),
+                merchant.act(surroundings=["Market stall"])
+            )
+    """
+    
+    __slots__ = (
+        "base_url",
+        "_url_health", "_url_npc_list", "_url_npc_register", "_url_npc_act",
+        "_url_npc_act_batch", "_url_tools_register", "_url_npc",
+        "_session", "_http_errors"
+    )
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = True,
+        timeout: float = 30.0
+    ):
+        """
+        Initialize the async NPC client.
+        
+        Args:
+            base_url: Base URL of the backend server
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept open
+            http2: Negotiate HTTP/2 with HTTPS backends
+            timeout: Request timeout in seconds
+        
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        httpx = _import_httpx("AsyncNPCClient")
+        
+        self.base_url = base_url.rstrip('/')
+        
+        # Endpoint URLs, built once rather than on every call
+        self._url_health = f"{self.base_url}/health"
+        self._url_npc_list = f"{self.base_url}/npc/list"
+        self._url_npc_register = f"{self.base_url}/npc/register"
+        self._url_npc_act = f"{self.base_url}/npc/act"
+        self._url_npc_act_batch = f"{self.base_url}/npc/act/batch"
+        self._url_tools_register = f"{self.base_url}/tools/register"
+        self._url_npc = f"{self.base_url}/npc/"  # + npc_id
+        
+        self._session = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            http2=http2,
+            timeout=timeout
+        )
+        # Unparseable bodies are reported like failed requests
+        self._http_errors = (httpx.HTTPError,) + _PARSE_ERRORS
+    
+    async def __aenter__(self) -> "AsyncNPCClient":
+        """Enter async context manager."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit async context manager, closing pooled connections."""
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._session.aclose()
+    
+    async def health_check(self) -> bool:
+        """
+        Check if the backend is running.
+        
+        Returns:
+            True if backend is healthy, False otherwise
+        """
+        try:
+            # HEAD skips the body; backends that predate HEAD support or the
+            # pong header (and anything else answering on the port) get a GET
+            response = await self._session.head(self._url_health, timeout=5)
+            if response.status_code == 200 and response.headers.get(_HEALTH_HEADER) == "pong":
+                return True
+            response = await self._session.get(self._url_health, timeout=5)
+            return response.content == b"pong"
+        except Exception:
+            return False
+    
+    def session(self, session_id: str) -> "AsyncSession":
+        """
+        Create a new session for managing tools and NPCs.
+        
+        Args:
+            session_id: Unique identifier for this game session
+        
+        Returns:
+            An AsyncSession instance
+        """
+        return AsyncSession(self, session_id)
+    
+    async def list_npcs(self) -> Dict[str, Any]:
+        """
+        List all registered NPCs.
+        
+        Returns:
+            Dict with 'count' and 'npcs' keys
+        """
+        try:
+            response = await self._session.get(self._url_npc_list)
+            response.raise_for_status()
+            return loads(response.content)
+        except _PARSE_ERRORS as e:
+            raise BackendError(f"Failed to list NPCs: invalid response: {e}")
+        except self._http_errors as e:
+            raise BackendConnectionError(f"Failed to list NPCs: {e}")
+    
+    async def delete_npc(self, npc_id: str) -> bool:
+        """
+        Delete an NPC.
+        
+        Args:
+            npc_id: ID of the NPC to delete
+        
+        Returns:
+            True if successful
+        """
+        try:
+            response = await self._session.delete(self._url_npc + npc_id)
+            response.raise_for_status()
+            return True
+        except self._http_errors as e:
+            raise BackendError(f"Failed to delete NPC: {e}")
+
+
+class AsyncSession(Session):
+    """
+    Manages a game session with tools and NPCs on an AsyncNPCClient.
+    
+    Usage:
+        session = client.session("my-session")
+        await session.register_tools([...])
+        npc = await session.create_npc(...)
+    """
+    
+    __slots__ = ()
+    
+    async def __aenter__(self) -> "AsyncSession":
+        """Enter async context manager."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit async context manager."""
+        pass
+    
+    async def register_tools(self, tools: List[Callable]) -> "AsyncSession":
+        """
+        Register game-specific tools for NPCs to use.
+        
+        Args:
+            tools: List of functions decorated with @tool
+        
+        Returns:
+            Self for method chaining
+        
+        Raises:
+            ToolRegistrationError: If registration fails
+        """
+        try:
+            response = await self.client._session.post(
+                self.client._url_tools_register,
+                content=self._tools_body(tools),
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+            self._tools_registered = True
+            return self
+        except self.client._http_errors as e:
+            raise ToolRegistrationError(f"Failed to register tools: {e}")
+    
+    async def create_npc(self, name: str, background: str) -> "AsyncNPC":
+        """
+        Create a new NPC.
+        
+        Args:
+            name: Name of the NPC
+            background: Background story/description
+        
+        Returns:
+            An AsyncNPC instance
+        
+        Raises:
+            BackendError: If NPC creation fails
+        """
+        payload = {
+            "name": name,
+            "background_story": background
+        }
+        
+        try:
+            response = await self.client._session.post(
+                self.client._url_npc_register,
+                content=dumps(payload),
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+            result = loads(response.content)
+            npc_id = result.get('npc_id')
+            
+            if not npc_id:
+                raise BackendError("Backend did not return npc_id")
+            
+            return AsyncNPC(
+                client=self.client,
+                session=self,
+                npc_id=npc_id,
+                name=name,
+                background=background
+            )
+        except self.client._http_errors as e:
+            raise BackendError(f"Failed to create NPC: {e}")
+    
+    async def act_batch(self, actions: List[Tuple[NPC, Any, Any, Any]]) -> List[Response]:
+        """
+        Execute one tick for several NPCs in a single request.
+        
+        Args:
+            actions: List of (npc, surroundings, events, knowledge_graph)
+                tuples, as accepted by Session.act_batch(). Longer lists
+                are sent as several concurrent batches of at most 64 acts.
+        
+        Returns:
+            One Response per action, in the same order
+        
+        Raises:
+            BackendError: If the batch request fails
+        """
+        if not actions:
+            return []
+        
+        if len(actions) > _MAX_BATCH_ACTS:
+            # The backend rejects larger batches with 413
+            batches = await asyncio.gather(*[
+                self.act_batch(actions[start:start + _MAX_BATCH_ACTS])
+                for start in range(0, len(actions), _MAX_BATCH_ACTS)
+            ])
+            return [response for batch in batches for response in batch]
+        
+        if self._batch_supported:
+            try:
+                response = await self.client._session.post(
+                    self.client._url_npc_act_batch,
+                    content=self._batch_body(actions),
+                    headers={"Content-Type": "application/json"}
+                )
+                if response.status_code in (404, 405):
+                    # Older backends route this path to /npc/{id}, which rejects POST
+                    self._batch_supported = False
+                else:
+                    response.raise_for_status()
+                    return [Response.from_dict(result) for result in loads(response.content)["responses"]]
+            except self.client._http_errors as e:
+                raise BackendError(f"Failed to execute NPC batch action: {e}")
+        
+        # Fall back to concurrent single acts
+        return list(await asyncio.gather(*[action[0].act(*action[1:]) for action in actions]))
+
+
+class AsyncNPC(NPC):
+    """
+    Represents an NPC whose actions are awaited.
+    
+    Usage:
+        response = await npc.act(
+            surroundings=["Forest", "Sword on ground"],
+            events=["You found a weapon"]
+        )
+    """
+    
+    __slots__ = ()
+    
+    async def act(
+        self,
+        surroundings: Union[
+            List[str],
+            List[Dict[str, str]],
+            List[Surrounding],
+            Surroundings,
+            ContextBuilder
+        ],
+        events: Optional[Union[List[str], List[Dict[str, str]], List[Event]]] = None,
+        knowledge_graph: Optional[Union[KnowledgeGraph, Dict]] = None,
+        cache: bool = True
+    ) -> Response:
+        """
+        Execute an action/tick for this NPC.
+        
+        Accepts the same arguments as NPC.act(). AsyncNPCClient has no act
+        cache, so cache is accepted for compatibility and ignored.
+        
+        Returns:
+            Response object with NPC's action result
+        
+        Raises:
+            BackendError: If the action fails
+        """
+        return await self._send_act(self._act_body(surroundings, events, knowledge_graph), cache)
+    
+    def act_async(
+        self,
+        surroundings: Union[
+            List[str],
+            List[Dict[str, str]],
+            List[Surrounding],
+            Surroundings,
+            ContextBuilder
+        ],
+        events: Optional[Union[List[str], List[Dict[str, str]], List[Event]]] = None,
+        knowledge_graph: Optional[Union[KnowledgeGraph, Dict]] = None,
+        cache: bool = True
+    ) -> "asyncio.Task[Response]":
+        """
+        Start an action/tick for this NPC without awaiting the result.
+        
+        Accepts the same arguments as act(). The request is encoded before
+        this returns, so the arguments may be modified straight away; it is
+        then sent from a task on the running event loop.
+        
+        Returns:
+            Task resolving to the Response, or raising BackendError if the
+            action fails
+        
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        body = self._act_body(surroundings, events, knowledge_graph)
+        return asyncio.get_running_loop().create_task(self._send_act(body, cache))
+    
+    async def _send_act(self, body: bytes, cache: bool = True) -> Response:
+        """Send an /npc/act request body built by _act_body(); AsyncNPCClient has no act cache."""
+        try:
+            response = await self.client._session.post(
+                self.client._url_npc_act,
+                content=body,
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+            result = loads(response.content)
+            
+            return Response.from_dict(result)
+        except self.client._http_errors as e:
+            raise BackendError(f"Failed to execute NPC action: {e}")
@@ -1,11 +1,15 @@
 """Main client for communicating with the LLM NPC Backend."""
 
-from typing import Any, Callable, Dict, List, Optional, Union
-import requests
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from ._json import dumps, loads
 from .models import Response, Surrounding, Event as EventModel
 from .context import Surroundings, Event, ContextBuilder, KnowledgeGraph
-from .decorators import is_tool, tool_to_backend_format
+from .decorators import is_tool, get_tool_schema_bytes
 from .exceptions import (
     BackendConnectionError,
     BackendError,
@@ -14,6 +18,123 @@ from .exceptions import (
     ToolRegistrationError
 )
 
+try:
+    import ijson
+except ImportError:  # ijson is optional; responses are parsed in one go without it
+    ijson = None
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+# The HTTP libraries are imported by the first client that needs one, so that
+# importing the SDK for @tool or the context builders stays fast
+_requests = None
+_httpx = None
+
+
+def _import_requests():
+    """Import requests on first use."""
+    global _requests
+    if _requests is None:
+        import requests
+        _requests = requests
+    return _requests
+
+
+def _import_httpx(feature: str):
+    """
+    Import httpx on first use.
+    
+    Args:
+        feature: What needs httpx, for the error message
+    
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    global _httpx
+    if _httpx is None:
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                f'{feature} requires httpx; install it with: pip install "llm-npc[async]"'
+            ) from None
+        _httpx = httpx
+    return _httpx
+
+# Responses at least this large (or of unknown length) are parsed incrementally
+_STREAM_PARSE_MIN_BYTES = 64 * 1024
+
+# Raised for response bodies that are not valid JSON; orjson's and the json
+# module's decode errors are both ValueErrors
+_PARSE_ERRORS: Tuple[type, ...] = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+# Header the backend's /health sets, so a body-less HEAD reply still says pong
+_HEALTH_HEADER = "X-Health"
+
+# Most acts the backend accepts in one /npc/act/batch request (MaxBatchActs)
+_MAX_BATCH_ACTS = 64
+
+
+# Encoders for the accepted surrounding and event item types, keyed on exact type
+_SURROUNDING_ENCODERS: Dict[type, Callable[[Any], bytes]] = {
+    # Simple string, use as both name and description
+    str: lambda item: dumps({"name": item, "description": item}),
+    Surrounding: Surrounding.to_json_bytes,
+    dict: dumps,
+}
+
+_EVENT_ENCODERS: Dict[type, Callable[[Any], bytes]] = {
+    # Simple string, use as both type and description
+    str: lambda item: dumps({"event_type": "event", "event_description": item}),
+    Event: Event.to_json_bytes,
+    EventModel: EventModel.to_json_bytes,
+    dict: dumps,
+}
+
+
+def _encode_array(items: Any, encoders: Dict[type, Callable[[Any], bytes]], kind: str) -> bytes:
+    """Encode items as a JSON array, dispatching on each item's type."""
+    try:
+        parts = [encoders[type(item)](item) for item in items]
+    except KeyError:
+        # Subclasses of the accepted types miss the exact-type lookup
+        parts = [_find_encoder(encoders, item, kind)(item) for item in items]
+    return b"[" + b",".join(parts) + b"]"
+
+
+def _find_encoder(
+    encoders: Dict[type, Callable[[Any], bytes]],
+    item: Any,
+    kind: str
+) -> Callable[[Any], bytes]:
+    """Find the encoder for an item whose exact type is not in the table."""
+    for item_type, encode in encoders.items():
+        if isinstance(item, item_type):
+            return encode
+    raise ValueError(f"Invalid {kind} type: {type(item)}")
+
+
+def _parse_streamed(response: Any) -> Any:
+    """
+    Parse the JSON body of a response from NPCClient._post_streamed().
+    
+    Large bodies are parsed incrementally from the socket with ijson, so
+    the raw bytes and the parsed result are never held in memory together.
+    """
+    if getattr(response, "raw", None) is None:
+        # httpx exposes no file-like raw stream for ijson to read from
+        return loads(response.read())
+    
+    length = response.headers.get("Content-Length")
+    if ijson is None or (length is not None and int(length) < _STREAM_PARSE_MIN_BYTES):
+        return loads(response.content)
+    
+    # Let urllib3 undo any Content-Encoding before ijson reads the raw stream
+    response.raw.decode_content = True
+    return next(ijson.items(response.raw, "", use_float=True))
+
 
 class NPCClient:
     """
@@ -25,17 +146,155 @@ class NPCClient:
         with client.session("my-game-session") as session:
             npc = session.create_npc("Gandalf", "A wise wizard")
             response = npc.act(surroundings=["Dark cave", "Dragon"])
+    
+    Instances use __slots__, so attributes cannot be added to them; a
+    subclass that needs that can add "__dict__" to its own __slots__.
     """
     
-    def __init__(self, base_url: str = "http://localhost:8080"):
+    __slots__ = (
+        "base_url",
+        "_url_health", "_url_npc_list", "_url_npc_register", "_url_npc_act",
+        "_url_npc_act_batch", "_url_tools_register", "_url_npc",
+        "_act_cache_size", "_act_cache", "_act_cache_lock",
+        "_use_httpx", "_session", "_http_errors", "_executor"
+    )
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        http2: bool = False,
+        act_cache_size: int = 0,
+        max_workers: int = 16
+    ):
         """
         Initialize the NPC client.
         
         Args:
             base_url: Base URL of the backend server
+            http2: Send requests through an httpx connection pool that
+                negotiates HTTP/2 with HTTPS backends, multiplexing
+                concurrent acts over one connection. Requires the
+                ``async`` extra: ``pip install "llm-npc[async]"``
+            act_cache_size: Number of successful NPC.act() responses to keep,
+                shared across NPCs. An act whose request is identical to a
+                cached one returns the cached Response without contacting
+                the backend. 0 disables the cache.
+            max_workers: Threads available to NPC.act_async() requests
+        
+        Raises:
+            ImportError: If http2 is set and httpx is not installed
         """
         self.base_url = base_url.rstrip('/')
-        self._session = requests.Session()
+        
+        # Endpoint URLs, built once rather than on every call
+        self._url_health = f"{self.base_url}/health"
+        self._url_npc_list = f"{self.base_url}/npc/list"
+        self._url_npc_register = f"{self.base_url}/npc/register"
+        self._url_npc_act = f"{self.base_url}/npc/act"
+        self._url_npc_act_batch = f"{self.base_url}/npc/act/batch"
+        self._url_tools_register = f"{self.base_url}/tools/register"
+        self._url_npc = f"{self.base_url}/npc/"  # + npc_id
+        
+        # Act responses keyed on the exact request body, least recently used first
+        self._act_cache_size = act_cache_size
+        self._act_cache: "OrderedDict[bytes, Response]" = OrderedDict()
+        self._act_cache_lock = threading.Lock()
+        
+        # Runs NPC.act_async() requests; threads are only started on first use
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-npc")
+        
+        self._use_httpx = http2
+        if http2:
+            httpx = _import_httpx("NPCClient(http2=True)")
+            self._session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=30.0,
+                headers={"Content-Type": "application/json"}
+            )
+            self._http_errors = (httpx.HTTPError,) + _PARSE_ERRORS
+        else:
+            requests = _import_requests()
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            self._session = requests.Session()
+            # Unparseable bodies are reported like failed requests
+            self._http_errors = (requests.RequestException,) + _PARSE_ERRORS
+            
+            # Size the pool for NPCs acting from many threads; the defaults (10)
+            # drop connections beyond that and lose their keep-alive
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.1,
+                    status_forcelist=[502, 503, 504],
+                    # Not POST: the backend answers 503/504 when inference is
+                    # unavailable or slow, where a retry only adds load, and
+                    # a retried /npc/register would create a duplicate NPC
+                    allowed_methods=["GET", "HEAD", "DELETE"]
+                )
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            self._session.headers.update({"Content-Type": "application/json"})
+    
+    def __enter__(self) -> "NPCClient":
+        """Enter context manager."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context manager, closing pooled connections."""
+        self.close()
+    
+    def close(self):
+        """Wait for pending NPC.act_async() requests, then close the underlying connection pool."""
+        self._executor.shutdown()
+        self._session.close()
+    
+    def clear_act_cache(self):
+        """Drop all cached NPC.act() responses."""
+        with self._act_cache_lock:
+            self._act_cache.clear()
+    
+    def _cached_act(self, body: bytes) -> Optional[Response]:
+        """Return the cached response for an act request body, if any."""
+        with self._act_cache_lock:
+            response = self._act_cache.get(body)
+            if response is not None:
+                self._act_cache.move_to_end(body)
+            return response
+    
+    def _cache_act(self, body: bytes, response: Response):
+        """Cache the response to an act request body, evicting the oldest entry when full."""
+        with self._act_cache_lock:
+            self._act_cache[body] = response
+            self._act_cache.move_to_end(body)
+            if len(self._act_cache) > self._act_cache_size:
+                self._act_cache.popitem(last=False)
+    
+    def _post(self, url: str, body: bytes) -> Any:
+        """POST a JSON request body and read the whole response."""
+        if self._use_httpx:
+            return self._session.post(url, content=body)
+        return self._session.post(url, data=body)
+    
+    @contextmanager
+    def _post_streamed(self, url: str, body: bytes) -> Iterator[Any]:
+        """
+        POST a JSON request body, leaving the response body unread.
+        
+        The response should be parsed with _parse_streamed() inside the with
+        block; leaving it returns the connection to the pool.
+        """
+        if self._use_httpx:
+            with self._session.stream("POST", url, content=body) as response:
+                yield response
+        else:
+            with self._session.post(url, data=body, stream=True) as response:
+                yield response
     
     def health_check(self) -> bool:
         """
@@ -45,8 +304,13 @@ class NPCClient:
             True if backend is healthy, False otherwise
         """
         try:
-            response = self._session.get(f"{self.base_url}/health", timeout=5)
-            return response.text == "pong"
+            # HEAD skips the body; backends that predate HEAD support or the
+            # pong header (and anything else answering on the port) get a GET
+            response = self._session.head(self._url_health, timeout=5)
+            if response.status_code == 200 and response.headers.get(_HEALTH_HEADER) == "pong":
+                return True
+            response = self._session.get(self._url_health, timeout=5)
+            return response.content == b"pong"
         except Exception:
             return False
     
@@ -70,10 +334,12 @@ class NPCClient:
             Dict with 'count' and 'npcs' keys
         """
         try:
-            response = self._session.get(f"{self.base_url}/npc/list")
+            response = self._session.get(self._url_npc_list)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return loads(response.content)
+        except _PARSE_ERRORS as e:
+            raise BackendError(f"Failed to list NPCs: invalid response: {e}")
+        except self._http_errors as e:
             raise BackendConnectionError(f"Failed to list NPCs: {e}")
     
     def delete_npc(self, npc_id: str) -> bool:
@@ -87,10 +353,10 @@ class NPCClient:
             True if successful
         """
         try:
-            response = self._session.delete(f"{self.base_url}/npc/{npc_id}")
+            response = self._session.delete(self._url_npc + npc_id)
             response.raise_for_status()
             return True
-        except requests.RequestException as e:
+        except self._http_errors as e:
             raise BackendError(f"Failed to delete NPC: {e}")
 
 
@@ -104,6 +370,8 @@ class Session:
             npc = session.create_npc(...)
     """
     
+    __slots__ = ("client", "session_id", "_tools_registered", "_batch_supported")
+    
     def __init__(self, client: NPCClient, session_id: str):
         """
         Initialize a session.
@@ -115,6 +383,7 @@ class Session:
         self.client = client
         self.session_id = session_id
         self._tools_registered = False
+        self._batch_supported = True
     
     def __enter__(self) -> "Session":
         """Enter context manager."""
@@ -137,32 +406,33 @@ class Session:
         Raises:
             ToolRegistrationError: If registration fails
         """
-        # Convert tools to backend format
+        try:
+            response = self.client._post(
+                self.client._url_tools_register,
+                self._tools_body(tools)
+            )
+            response.raise_for_status()
+            self._tools_registered = True
+            return self
+        except self.client._http_errors as e:
+            raise ToolRegistrationError(f"Failed to register tools: {e}")
+    
+    def _tools_body(self, tools: List[Callable]) -> bytes:
+        """Build the /tools/register request body for a list of @tool functions."""
+        # Collect the schemas encoded at decoration time
         tool_specs = []
         for tool_func in tools:
             if not is_tool(tool_func):
                 raise ToolRegistrationError(
                     f"Function {tool_func.__name__} is not decorated with @tool"
                 )
-            tool_specs.append(tool_to_backend_format(tool_func))
+            tool_specs.append(get_tool_schema_bytes(tool_func))
         
-        # Send to backend
-        payload = {
-            "session_id": self.session_id,
-            "tools": tool_specs
-        }
-        
-        try:
-            response = self.client._session.post(
-                f"{self.client.base_url}/tools/register",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            self._tools_registered = True
-            return self
-        except requests.RequestException as e:
-            raise ToolRegistrationError(f"Failed to register tools: {e}")
+        # Splice them into the request body without re-serializing
+        return b'{"session_id":%s,"tools":[%s]}' % (
+            dumps(self.session_id),
+            b",".join(tool_specs)
+        )
     
     def create_npc(self, name: str, background: str) -> "NPC":
         """
@@ -184,13 +454,9 @@ class Session:
         }
         
         try:
-            response = self.client._session.post(
-                f"{self.client.base_url}/npc/register",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
+            response = self.client._post(self.client._url_npc_register, dumps(payload))
             response.raise_for_status()
-            result = response.json()
+            result = loads(response.content)
             npc_id = result.get('npc_id')
             
             if not npc_id:
@@ -203,8 +469,69 @@ class Session:
                 name=name,
                 background=background
             )
-        except requests.RequestException as e:
+        except self.client._http_errors as e:
             raise BackendError(f"Failed to create NPC: {e}")
+    
+    def act_batch(
+        self,
+        actions: List[Tuple["NPC", Any, Any, Any]],
+        max_workers: int = 8
+    ) -> List[Response]:
+        """
+        Execute one tick for several NPCs in a single request.
+        
+        Args:
+            actions: List of (npc, surroundings, events, knowledge_graph)
+                tuples, taking the same forms as the arguments of NPC.act().
+                events and knowledge_graph may be None. Longer lists are
+                sent as several batches of at most 64 acts.
+            max_workers: Threads used to send the acts individually when the
+                backend has no batch endpoint
+        
+        Returns:
+            One Response per action, in the same order
+        
+        Raises:
+            BackendError: If the batch request fails
+        """
+        if not actions:
+            return []
+        
+        if len(actions) > _MAX_BATCH_ACTS:
+            # The backend rejects larger batches with 413
+            return [
+                response
+                for start in range(0, len(actions), _MAX_BATCH_ACTS)
+                for response in self.act_batch(actions[start:start + _MAX_BATCH_ACTS], max_workers)
+            ]
+        
+        if self._batch_supported:
+            try:
+                with self.client._post_streamed(
+                    self.client._url_npc_act_batch,
+                    self._batch_body(actions)
+                ) as response:
+                    if response.status_code in (404, 405):
+                        # Older backends route this path to /npc/{id}, which rejects POST
+                        self._batch_supported = False
+                    else:
+                        response.raise_for_status()
+                        results = _parse_streamed(response)["responses"]
+                        return [Response.from_dict(result) for result in results]
+            except self.client._http_errors as e:
+                raise BackendError(f"Failed to execute NPC batch action: {e}")
+        
+        # Fall back to concurrent single acts sharing the pooled session
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(actions))) as executor:
+            return list(executor.map(lambda action: action[0].act(*action[1:]), actions))
+    
+    def _batch_body(self, actions: List[Tuple["NPC", Any, Any, Any]]) -> bytes:
+        """Build the /npc/act/batch request body for act_batch()."""
+        # Each act carries its own npc_id and session_id, exactly as NPC.act() would send it
+        return b'{"acts":[%s]}' % b",".join([
+            npc._act_body(surroundings, events, knowledge_graph)
+            for npc, surroundings, events, knowledge_graph in actions
+        ])
 
 
 class NPC:
@@ -218,6 +545,8 @@ class NPC:
         )
     """
     
+    __slots__ = ("client", "session", "npc_id", "name", "background")
+    
     def __init__(
         self,
         client: NPCClient,
@@ -252,7 +581,8 @@ class NPC:
             ContextBuilder
         ],
         events: Optional[Union[List[str], List[Dict[str, str]], List[Event]]] = None,
-        knowledge_graph: Optional[Union[KnowledgeGraph, Dict]] = None
+        knowledge_graph: Optional[Union[KnowledgeGraph, Dict]] = None,
+        cache: bool = True
     ) -> Response:
         """
         Execute an action/tick for this NPC.
@@ -271,6 +601,8 @@ class NPC:
             knowledge_graph: Optional knowledge graph for NPC memory. Can be:
                 - KnowledgeGraph object
                 - Dict with "nodes" and "edges"
+            cache: Whether this act may be answered from, and stored in, the
+                client's act cache (see NPCClient's act_cache_size)
         
         Returns:
             Response object with NPC's action result
@@ -278,47 +610,105 @@ class NPC:
         Raises:
             BackendError: If the action fails
         """
-        # Build the payload
-        payload = {"npc_id": self.npc_id}
+        return self._send_act(self._act_body(surroundings, events, knowledge_graph), cache)
+    
+    def act_async(
+        self,
+        surroundings: Union[
+            List[str],
+            List[Dict[str, str]],
+            List[Surrounding],
+            Surroundings,
+            ContextBuilder
+        ],
+        events: Optional[Union[List[str], List[Dict[str, str]], List[Event]]] = None,
+        knowledge_graph: Optional[Union[KnowledgeGraph, Dict]] = None,
+        cache: bool = True
+    ) -> "Future[Response]":
+        """
+        Start an action/tick for this NPC without waiting for the result.
         
-        # Add session_id if tools were registered
-        if self.session._tools_registered:
-            payload["session_id"] = self.session.session_id
+        Accepts the same arguments as act(). The request is encoded before
+        this returns, so the arguments may be modified straight away; it is
+        then sent from the client's thread pool while the caller carries on.
         
-        # Handle different input types for surroundings
-        if isinstance(surroundings, ContextBuilder):
-            # ContextBuilder provides everything
-            context = surroundings.build()
-            payload["surroundings"] = context["surroundings"]
-            if "events" in context:
-                payload["events"] = context["events"]
-            if "knowledge_graph" in context:
-                payload["knowledge_graph"] = context["knowledge_graph"]
-        else:
-            # Convert surroundings to proper format
-            payload["surroundings"] = self._convert_surroundings(surroundings)
-            
-            # Convert events if provided
-            if events is not None:
-                payload["events"] = self._convert_events(events)
-            
-            # Convert knowledge graph if provided
-            if knowledge_graph is not None:
-                payload["knowledge_graph"] = self._convert_knowledge_graph(knowledge_graph)
+        Returns:
+            Future resolving to the Response, or raising BackendError if the
+            action fails
+        """
+        body = self._act_body(surroundings, events, knowledge_graph)
+        return self.client._executor.submit(self._send_act, body, cache)
+    
+    def _send_act(self, body: bytes, cache: bool) -> Response:
+        """Send an /npc/act request body built by _act_body()."""
+        client = self.client
+        
+        use_cache = cache and client._act_cache_size > 0
+        if use_cache:
+            cached = client._cached_act(body)
+            if cached is not None:
+                return cached
         
         # Make the request
         try:
-            response = self.client._session.post(
-                f"{self.client.base_url}/npc/act",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            return Response.from_dict(result)
-        except requests.RequestException as e:
+            # Streamed so large results are parsed as they arrive; the with
+            # block returns the connection to the pool once parsing is done
+            with client._post_streamed(client._url_npc_act, body) as response:
+                response.raise_for_status()
+                result = Response.from_dict(_parse_streamed(response))
+        except client._http_errors as e:
             raise BackendError(f"Failed to execute NPC action: {e}")
+        
+        if use_cache and result.success:
+            client._cache_act(body, result)
+        return result
+    
+    def _act_body(
+        self,
+        surroundings: Union[
+            List[str],
+            List[Dict[str, str]],
+            List[Surrounding],
+            Surroundings,
+            ContextBuilder
+        ],
+        events: Optional[Union[List[str], List[Dict[str, str]], List[Event]]],
+        knowledge_graph: Optional[Union[KnowledgeGraph, Dict]]
+    ) -> bytes:
+        """Build the /npc/act request body from the arguments accepted by act()."""
+        # Add session_id if tools were registered
+        session_id = self.session.session_id if self.session._tools_registered else None
+        
+        # Handle different input types for surroundings
+        if isinstance(surroundings, ContextBuilder):
+            # ContextBuilder provides everything, already encoded
+            return surroundings.to_json_bytes(npc_id=self.npc_id, session_id=session_id)
+        
+        # Build the payload
+        payload = {"npc_id": self.npc_id}
+        if session_id is not None:
+            payload["session_id"] = session_id
+        
+        # Surroundings, events and the knowledge graph are spliced in as
+        # pre-encoded JSON so that parts reused across ticks keep their cached encoding
+        parts = [
+            dumps(payload)[:-1],
+            b',"surroundings":',
+            self._convert_surroundings(surroundings)
+        ]
+        
+        # Convert events if provided
+        if events is not None:
+            parts.append(b',"events":')
+            parts.append(self._convert_events(events))
+        
+        # Convert knowledge graph if provided
+        if knowledge_graph is not None:
+            parts.append(b',"knowledge_graph":')
+            parts.append(self._convert_knowledge_graph(knowledge_graph))
+        parts.append(b"}")
+        
+        return b"".join(parts)
     
     def _convert_surroundings(
         self,
@@ -328,58 +718,29 @@ class NPC:
             List[Surrounding],
             Surroundings
         ]
-    ) -> List[Dict[str, str]]:
-        """Convert surroundings to backend format."""
-        if isinstance(surroundings, Surroundings):
-            return surroundings.to_list()
-        
-        result = []
-        for item in surroundings:
-            if isinstance(item, str):
-                # Simple string, use as both name and description
-                result.append({"name": item, "description": item})
-            elif isinstance(item, Surrounding):
-                result.append(item.to_dict())
-            elif isinstance(item, dict):
-                result.append(item)
-            else:
-                raise ValueError(f"Invalid surrounding type: {type(item)}")
+    ) -> bytes:
+        """Convert surroundings to a backend JSON array."""
+        if type(surroundings) is Surroundings:
+            return surroundings.to_json()
         
-        return result
+        return _encode_array(surroundings, _SURROUNDING_ENCODERS, "surrounding")
     
     def _convert_events(
         self,
         events: Union[List[str], List[Dict[str, str]], List[Event]]
-    ) -> List[Dict[str, str]]:
-        """Convert events to backend format."""
-        result = []
-        for item in events:
-            if isinstance(item, str):
-                # Simple string, use as both type and description
-                result.append({
-                    "event_type": "event",
-                    "event_description": item
-                })
-            elif isinstance(item, Event):
-                result.append(item.to_dict())
-            elif isinstance(item, EventModel):
-                result.append(item.to_dict())
-            elif isinstance(item, dict):
-                result.append(item)
-            else:
-                raise ValueError(f"Invalid event type: {type(item)}")
-        
-        return result
+    ) -> bytes:
+        """Convert events to a backend JSON array."""
+        return _encode_array(events, _EVENT_ENCODERS, "event")
     
     def _convert_knowledge_graph(
         self,
         knowledge_graph: Union[KnowledgeGraph, Dict]
-    ) -> Dict[str, Any]:
-        """Convert knowledge graph to backend format."""
+    ) -> bytes:
+        """Convert knowledge graph to backend JSON."""
         if isinstance(knowledge_graph, KnowledgeGraph):
-            return knowledge_graph.to_dict()
+            return knowledge_graph.to_json_bytes()
         elif isinstance(knowledge_graph, dict):
-            return knowledge_graph
+            return dumps(knowledge_graph)
         else:
             raise ValueError(f"Invalid knowledge graph type: {type(knowledge_graph)}")
     
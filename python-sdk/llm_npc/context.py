@@ -1,6 +1,7 @@
 """Context builders for constructing NPC surroundings, events, and knowledge graphs."""
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
+from ._json import dumps
 from .models import Surrounding, Event as EventModel
 
 
@@ -17,8 +18,14 @@ class Surroundings:
         surroundings.add("Stranger", "A hooded figure in the corner")
     """
     
+    # Names and descriptions are kept in parallel lists rather than as one
+    # Surrounding object per entry, which is much smaller for large maps
+    __slots__ = ("_names", "_descriptions", "_json")
+    
     def __init__(self):
-        self._items: List[Surrounding] = []
+        self._names: List[str] = []
+        self._descriptions: List[str] = []
+        self._json: Optional[bytes] = None
     
     def add(self, name: str, description: str) -> "Surroundings":
         """
@@ -31,24 +38,42 @@ class Surroundings:
         Returns:
             Self for method chaining
         """
-        self._items.append(Surrounding(name=name, description=description))
+        self._names.append(name)
+        self._descriptions.append(description)
+        self._json = None
         return self
     
     def to_list(self) -> List[Dict[str, str]]:
         """Convert to backend API format (list of dicts)."""
-        return [item.to_dict() for item in self._items]
+        return [
+            {"name": name, "description": description}
+            for name, description in zip(self._names, self._descriptions)
+        ]
+    
+    def to_json(self) -> bytes:
+        """
+        Encode to backend API JSON.
+        
+        The encoding is cached until the next add(), so surroundings passed
+        to many NPCs or ticks are only serialized once.
+        """
+        if self._json is None:
+            self._json = dumps(self.to_list())
+        return self._json
     
     def __iter__(self):
         """Allow iteration over surroundings."""
-        return iter(self._items)
+        return map(Surrounding, self._names, self._descriptions)
     
     def __len__(self):
         """Get number of surroundings."""
-        return len(self._items)
+        return len(self._names)
     
     def __getitem__(self, index):
         """Get surrounding by index."""
-        return self._items[index]
+        if isinstance(index, slice):
+            return list(map(Surrounding, self._names[index], self._descriptions[index]))
+        return Surrounding(self._names[index], self._descriptions[index])
 
 
 class Event:
@@ -59,16 +84,32 @@ class Event:
         event = Event("discovery", "You found a hidden passage")
     """
     
+    __slots__ = ("event_type", "event_description", "_dict", "_json")
+    
     def __init__(self, event_type: str, event_description: str):
         self.event_type = event_type
         self.event_description = event_description
+        self._dict = None
+        self._json = None
     
     def to_dict(self) -> Dict[str, str]:
-        """Convert to backend API format."""
-        return {
-            "event_type": self.event_type,
-            "event_description": self.event_description
-        }
+        """Convert to backend API format, reusing the dict from earlier calls if unchanged."""
+        d = self._dict
+        if (d is None or d["event_type"] is not self.event_type
+                or d["event_description"] is not self.event_description):
+            d = self._dict = {
+                "event_type": self.event_type,
+                "event_description": self.event_description
+            }
+        return d
+    
+    def to_json_bytes(self) -> bytes:
+        """Encode to backend API JSON, reusing the bytes from earlier ticks if unchanged."""
+        d = self.to_dict()
+        cached = self._json
+        if cached is None or cached[0] is not d:
+            cached = self._json = (d, dumps(d))
+        return cached[1]
 
 
 class KnowledgeGraph:
@@ -82,9 +123,22 @@ class KnowledgeGraph:
         kg.add_edge("player", "quest", relationship="active")
     """
     
+    # Node and edge fields are kept in parallel lists; the API dicts are
+    # only built when the graph is serialized
+    __slots__ = (
+        "_node_ids", "_node_data",
+        "_edge_sources", "_edge_targets", "_edge_data",
+        "_dirty", "_cached_bytes"
+    )
+    
     def __init__(self):
-        self._nodes: List[Dict[str, Any]] = []
-        self._edges: List[Dict[str, Any]] = []
+        self._node_ids: List[str] = []
+        self._node_data: List[Dict[str, Any]] = []
+        self._edge_sources: List[str] = []
+        self._edge_targets: List[str] = []
+        self._edge_data: List[Dict[str, Any]] = []
+        self._dirty = True
+        self._cached_bytes: Optional[bytes] = None
     
     def add_node(self, node_id: str, **data: Any) -> "KnowledgeGraph":
         """
@@ -97,10 +151,9 @@ class KnowledgeGraph:
         Returns:
             Self for method chaining
         """
-        self._nodes.append({
-            "id": node_id,
-            "data": data
-        })
+        self._node_ids.append(node_id)
+        self._node_data.append(data)
+        self._dirty = True
         return self
     
     def add_edge(self, source: str, target: str, **data: Any) -> "KnowledgeGraph":
@@ -115,23 +168,40 @@ class KnowledgeGraph:
         Returns:
             Self for method chaining
         """
-        self._edges.append({
-            "source": source,
-            "target": target,
-            "data": data
-        })
+        self._edge_sources.append(source)
+        self._edge_targets.append(target)
+        self._edge_data.append(data)
+        self._dirty = True
         return self
     
     def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
         """Convert to backend API format."""
         return {
-            "nodes": self._nodes,
-            "edges": self._edges
+            "nodes": [
+                {"id": node_id, "data": data}
+                for node_id, data in zip(self._node_ids, self._node_data)
+            ],
+            "edges": [
+                {"source": source, "target": target, "data": data}
+                for source, target, data in zip(self._edge_sources, self._edge_targets, self._edge_data)
+            ]
         }
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Encode to backend API JSON.
+        
+        The encoding is cached until the next add_node() or add_edge(), so a
+        graph passed to several NPCs or ticks is only serialized once.
+        """
+        if self._dirty:
+            self._cached_bytes = dumps(self.to_dict())
+            self._dirty = False
+        return self._cached_bytes
+    
     def __len__(self):
         """Get total number of nodes and edges."""
-        return len(self._nodes) + len(self._edges)
+        return len(self._node_ids) + len(self._edge_sources)
 
 
 class ContextBuilder:
@@ -215,6 +285,38 @@ class ContextBuilder:
         
         return result
     
+    def to_json_bytes(self, npc_id: Optional[str] = None, session_id: Optional[str] = None) -> bytes:
+        """
+        Encode the complete context as JSON for the backend API.
+        
+        Equivalent to encoding build(), but assembled from the cached
+        encodings of the surroundings, events and knowledge graph, so no
+        intermediate dicts are built.
+        
+        Args:
+            npc_id: NPC ID to include, making the result an /npc/act request body
+            session_id: Session ID to include alongside npc_id
+        
+        Returns:
+            The encoded JSON object
+        """
+        parts = [b"{"]
+        if npc_id is not None:
+            parts += (b'"npc_id":', dumps(npc_id), b",")
+        if session_id is not None:
+            parts += (b'"session_id":', dumps(session_id), b",")
+        
+        parts += (b'"surroundings":', self._surroundings.to_json())
+        
+        if self._events:
+            parts += (b',"events":[', b",".join([event.to_json_bytes() for event in self._events]), b"]")
+        
+        if self._knowledge_graph:
+            parts += (b',"knowledge_graph":', self._knowledge_graph.to_json_bytes())
+        
+        parts.append(b"}")
+        return b"".join(parts)
+    
     @property
     def surroundings(self) -> Surroundings:
         """Get the surroundings builder."""
@@ -1,8 +1,31 @@
 """Decorators for defining game tools."""
 
 import inspect
-from typing import Any, Callable, Dict, Optional, get_type_hints
-from functools import wraps
+from typing import Any, Callable, Dict, Optional, Union, get_args, get_origin, get_type_hints
+from functools import lru_cache
+
+from ._json import dumps
+
+
+# Backend schema types for Python type hints (and the string forms left by
+# annotations that cannot be resolved); anything else is sent as "string"
+_TYPE_MAP = {
+    str: "string",
+    int: "number",
+    float: "number",
+    bool: "boolean",
+    dict: "object",
+    list: "array",
+    tuple: "array",
+    "str": "string",
+    "int": "number",
+    "float": "number",
+    "bool": "boolean",
+    "dict": "object",
+    "list": "array",
+}
+
+_NONE_TYPE = type(None)
 
 
 def tool(
@@ -18,6 +41,9 @@ def tool(
     - Description from docstring or explicit description parameter
     - Parameters from function signature with type hints
     
+    The function is returned unchanged (not wrapped), with the tool
+    metadata stored as attributes on it.
+    
     Args:
         func: The function to decorate (when used without arguments)
         description: Optional explicit description (overrides docstring)
@@ -45,18 +71,17 @@ def tool(
             "parameters": parameters
         }
         
-        # Mark it as a tool
-        f._is_tool = True
+        # The backend format is identical to the metadata, computed here once
+        f._backend_format = f._tool_metadata
         
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            return f(*args, **kwargs)
+        # Pre-encode the schema once so registering the tool never re-serializes it
+        f._schema_bytes = dumps(f._tool_metadata)
         
-        # Copy metadata to wrapper
-        wrapper._tool_metadata = f._tool_metadata
-        wrapper._is_tool = True
+        # Mark it as a tool
+        f._is_tool = True
         
-        return wrapper
+        # Return the function itself so calling a tool adds no extra frame
+        return f
     
     # Handle both @tool and @tool() syntax
     if func is None:
@@ -85,14 +110,18 @@ def _extract_parameters(func: Callable) -> Dict[str, Dict[str, Any]]:
     Returns a dict matching the backend tool schema format:
     {
         "param_name": {
-            "type": "string|integer|boolean|float",
+            "type": "string|number|boolean|object|array",
             "description": "...",
             "required": true|false
         }
     }
     """
     sig = inspect.signature(func)
-    type_hints = get_type_hints(func) if hasattr(inspect, 'get_type_hints') else {}
+    try:
+        type_hints = get_type_hints(func)
+    except Exception:
+        # Unresolvable forward references; map the annotations as written
+        type_hints = getattr(func, '__annotations__', {})
     
     # Parse docstring for parameter descriptions
     param_descriptions = _parse_param_descriptions(func)
@@ -133,63 +162,52 @@ def _parse_param_descriptions(func: Callable) -> Dict[str, str]:
     if not docstring:
         return {}
     
+    return _parse_args_section(docstring)
+
+
+@lru_cache(maxsize=512)
+def _parse_args_section(docstring: str) -> Dict[str, str]:
+    """Extract "name: description" entries from a docstring's Args section."""
     descriptions = {}
-    lines = docstring.split('\n')
     
     # Look for Args: section
     in_args_section = False
-    for line in lines:
+    for line in docstring.split('\n'):
         stripped = line.strip()
+        lowered = stripped.lower()
         
-        if stripped.lower().startswith('args:') or stripped.lower().startswith('parameters:'):
+        if lowered.startswith('args:') or lowered.startswith('parameters:'):
             in_args_section = True
             continue
         
         if in_args_section:
             # Stop at next section
-            if stripped and not stripped[0].isspace() and ':' in stripped and stripped[0].isupper():
+            if stripped and ':' in stripped and stripped[0].isupper():
                 break
             
             # Parse parameter line: "param_name: description" or "param_name (type): description"
             if ':' in stripped:
-                parts = stripped.split(':', 1)
-                param_part = parts[0].strip()
-                desc_part = parts[1].strip() if len(parts) > 1 else ""
+                param_part, desc_part = stripped.split(':', 1)
                 
                 # Remove type hints in parentheses
-                if '(' in param_part:
-                    param_part = param_part.split('(')[0].strip()
+                param_part = param_part.split('(', 1)[0].strip()
                 
                 if param_part:
-                    descriptions[param_part] = desc_part
+                    descriptions[param_part] = desc_part.strip()
     
     return descriptions
 
 
 def _python_type_to_schema_type(py_type: Any) -> str:
     """Convert Python type hint to backend schema type string."""
-    # Handle Optional types
-    origin = getattr(py_type, '__origin__', None)
-    if origin is not None:
-        # Handle Optional[T] which is Union[T, None]
-        args = getattr(py_type, '__args__', ())
-        if origin is type(None) or (hasattr(origin, '__name__') and 'Union' in str(origin)):
-            # Get the non-None type
-            non_none_types = [t for t in args if t is not type(None)]
-            if non_none_types:
-                py_type = non_none_types[0]
-    
-    # Map Python types to schema types
-    if py_type == str or py_type == 'str':
-        return "string"
-    elif py_type == int or py_type == 'int':
-        return "integer"
-    elif py_type == float or py_type == 'float':
-        return "float"
-    elif py_type == bool or py_type == 'bool':
-        return "boolean"
-    else:
-        return "string"  # default
+    # Handle Optional[T], which is Union[T, None], by taking the non-None type
+    if get_origin(py_type) is Union:
+        py_type = next((t for t in get_args(py_type) if t is not _NONE_TYPE), str)
+    
+    # Generic aliases such as List[str] or Dict[str, int] map like their origin
+    py_type = get_origin(py_type) or py_type
+    
+    return _TYPE_MAP.get(py_type, "string")
 
 
 def is_tool(func: Callable) -> bool:
@@ -202,6 +220,14 @@ def get_tool_metadata(func: Callable) -> Optional[Dict[str, Any]]:
     return getattr(func, '_tool_metadata', None)
 
 
+def get_tool_schema_bytes(func: Callable) -> bytes:
+    """Get the tool's backend-format schema, pre-encoded as JSON bytes."""
+    if not is_tool(func):
+        raise ValueError(f"Function {func.__name__} is not decorated with @tool")
+    
+    return func._schema_bytes
+
+
 def tool_to_backend_format(func: Callable) -> Dict[str, Any]:
     """
     Convert a decorated tool function to backend API format.
@@ -219,5 +245,5 @@ def tool_to_backend_format(func: Callable) -> Dict[str, Any]:
     if not is_tool(func):
         raise ValueError(f"Function {func.__name__} is not decorated with @tool")
     
-    return get_tool_metadata(func)
+    return func._backend_format
 
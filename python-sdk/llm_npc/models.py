@@ -1,127 +1,349 @@
 """Typed models for the LLM NPC SDK."""
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import os
+import sys
+from dataclasses import InitVar, dataclass, field
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Sequence
 
+from ._json import dumps, loads
 
-@dataclass
+
+# Response models are created by the hundred per reply, so they drop their
+# per-instance __dict__ where dataclasses support it (Python 3.10+); slots
+# cannot be declared by hand alongside field defaults
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Most instances kept in each model's free list for reuse after release()
+_POOL_SIZE = 1024
+
+# Whether from_dict() keeps the backend JSON as raw_data when not told
+# explicitly. Off by default, since it holds every parsed payload in memory
+# for as long as its Response lives; set LLM_NPC_KEEP_RAW=1 to debug
+KEEP_RAW = os.environ.get("LLM_NPC_KEEP_RAW", "") not in ("", "0")
+
+# Shared by every round without tool calls and response without rounds
+_EMPTY: tuple = ()
+
+
+def _reuse_or_new(cls: type) -> Any:
+    """Take an instance from the model's pool, or allocate one without calling __init__."""
+    pool = cls._pool
+    if pool:
+        try:
+            return pool.pop()
+        except IndexError:  # emptied by another thread since the check
+            pass
+    return cls.__new__(cls)
+
+
+def _get_raw_data(self) -> Optional[Dict[str, Any]]:
+    """The backend JSON this was created from, when it was kept (see KEEP_RAW)."""
+    raw = self._raw
+    if type(raw) is bytes:
+        # Kept encoded by Response.from_bytes(); decoded on first access
+        raw = self._raw = loads(raw)
+    return raw
+
+
+def _set_raw_data(self, value: Optional[Dict[str, Any]]):
+    self._raw = value
+
+
+@dataclass(frozen=True)
 class Surrounding:
     """Represents an object or entity in the NPC's surroundings."""
     
+    # Instances are immutable, so _dict and _json cache the encodings for
+    # good; they are set on first use
+    __slots__ = ("name", "description", "_dict", "_json")
+    
     name: str
     description: str
     
     def to_dict(self) -> Dict[str, str]:
-        """Convert to backend API format."""
-        return {
-            "name": self.name,
-            "description": self.description
-        }
+        """Convert to backend API format. The dict is cached, so it must not be modified."""
+        try:
+            return self._dict
+        except AttributeError:
+            d = {"name": self.name, "description": self.description}
+            object.__setattr__(self, "_dict", d)
+            return d
+    
+    def to_json_bytes(self) -> bytes:
+        """Encode to backend API JSON, cached after the first call."""
+        try:
+            return self._json
+        except AttributeError:
+            encoded = dumps(self.to_dict())
+            object.__setattr__(self, "_json", encoded)
+            return encoded
+    
+    def __reduce__(self):
+        # Frozen fields cannot be restored through setattr; rebuild from the fields instead
+        return (type(self), (self.name, self.description))
 
 
-@dataclass
+@dataclass(frozen=True)
 class Event:
     """Represents an event that has occurred in the game."""
     
+    # Instances are immutable, so _dict and _json cache the encodings for
+    # good; they are set on first use
+    __slots__ = ("event_type", "event_description", "_dict", "_json")
+    
     event_type: str
     event_description: str
     
     def to_dict(self) -> Dict[str, str]:
-        """Convert to backend API format."""
-        return {
-            "event_type": self.event_type,
-            "event_description": self.event_description
-        }
+        """Convert to backend API format. The dict is cached, so it must not be modified."""
+        try:
+            return self._dict
+        except AttributeError:
+            d = {"event_type": self.event_type, "event_description": self.event_description}
+            object.__setattr__(self, "_dict", d)
+            return d
+    
+    def to_json_bytes(self) -> bytes:
+        """Encode to backend API JSON, cached after the first call."""
+        try:
+            return self._json
+        except AttributeError:
+            encoded = dumps(self.to_dict())
+            object.__setattr__(self, "_json", encoded)
+            return encoded
+    
+    def __reduce__(self):
+        # Frozen fields cannot be restored through setattr; rebuild from the fields instead
+        return (type(self), (self.event_type, self.event_description))
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ToolCall:
     """Represents a tool call made by the NPC."""
     
+    # Released instances, reused by from_dict()
+    _pool: ClassVar[List["ToolCall"]] = []
+    
     tool_name: str
     args: Dict[str, Any]
     success: bool
     response: Optional[str] = None
     result: Optional[str] = None
+    # Alias for tool_name for convenience. Stored rather than computed so that
+    # reading it is a plain attribute access; set along with tool_name
+    name: str = field(init=False, repr=False, compare=False)
+    # Set while the instance sits in the pool, so a second release() is a no-op
+    _released: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.name = self.tool_name
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ToolCall":
         """Create from backend response."""
-        return cls(
-            tool_name=data.get("tool_name", ""),
-            args=data.get("args", {}),
-            success=data.get("success", False),
-            response=data.get("response"),
-            result=data.get("result")
-        )
+        # Every field is assigned below, so the generated __init__ is skipped.
+        # This runs once per tool call, so the empty-pool case is inlined
+        obj = _reuse_or_new(cls) if cls._pool else cls.__new__(cls)
+        
+        # The backend always sends tool_name, args and success; index them
+        # directly and only fall back to defaults for other producers
+        try:
+            # Names come from the session's few registered tools; interning keeps
+            # one copy of each and lets comparisons short-circuit on identity
+            obj.name = obj.tool_name = sys.intern(data["tool_name"])
+            obj.args = data["args"] or {}
+            obj.success = data["success"]
+        except KeyError:
+            obj.name = obj.tool_name = sys.intern(data.get("tool_name", ""))
+            obj.args = data.get("args") or {}
+            obj.success = data.get("success", False)
+        obj.response = data.get("response")
+        obj.result = data.get("result")
+        obj._released = False
+        return obj
     
-    @property
-    def name(self) -> str:
-        """Alias for tool_name for convenience."""
-        return self.tool_name
+    def release(self):
+        """Return this tool call to the pool reused by from_dict(); later calls do nothing."""
+        if self._released:
+            return
+        self._released = True
+        self.args = None
+        self.response = self.result = None
+        pool = ToolCall._pool
+        if len(pool) < _POOL_SIZE:
+            pool.append(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Round:
     """Represents a single round of NPC inference."""
     
-    tools_used: List[ToolCall] = field(default_factory=list)
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    # Released instances, reused by from_dict()
+    _pool: ClassVar[List["Round"]] = []
+    
+    # Empty sequences are the shared _EMPTY rather than a fresh list per instance
+    tools_used: Sequence[ToolCall] = _EMPTY
+    # Accepted by the constructor and exposed as the raw_data property below
+    raw_data: InitVar[Optional[Dict[str, Any]]] = None
+    _raw: Any = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self, raw_data: Optional[Dict[str, Any]]):
+        self._raw = raw_data
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Round":
-        """Create from backend response."""
-        tools_used = [
-            ToolCall.from_dict(tool) 
-            for tool in data.get("tools_used", [])
-        ]
-        return cls(
-            tools_used=tools_used,
-            raw_data=data
-        )
+    def from_dict(cls, data: Dict[str, Any], keep_raw: Optional[bool] = None) -> "Round":
+        """
+        Create from backend response.
+        
+        Args:
+            data: The round as returned by the backend
+            keep_raw: Keep data as raw_data; defaults to the module's KEEP_RAW
+        """
+        # map() calls the bound constructor from C, without a per-item lookup
+        tools = data.get("tools_used")
+        tools_used = list(map(ToolCall.from_dict, tools)) if tools else _EMPTY
+        obj = _reuse_or_new(cls)
+        
+        obj.tools_used = tools_used
+        obj._raw = data if (KEEP_RAW if keep_raw is None else keep_raw) else None
+        return obj
+    
+    def release(self):
+        """Return this round and its tool calls to the pools reused by from_dict()."""
+        if self.tools_used is None:  # already released
+            return
+        for tool_call in self.tools_used:
+            tool_call.release()
+        self.tools_used = self._raw = None
+        pool = Round._pool
+        if len(pool) < _POOL_SIZE:
+            pool.append(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Response:
     """Represents the response from an NPC action."""
     
+    # Released instances, reused by from_dict()
+    _pool: ClassVar[List["Response"]] = []
+    
     success: bool
     text: str
-    rounds: List[Round] = field(default_factory=list)
-    tools_used: List[ToolCall] = field(default_factory=list)
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    # Empty sequences are the shared _EMPTY rather than a fresh list per instance
+    rounds: Sequence[Round] = _EMPTY
+    tools_used: Sequence[ToolCall] = _EMPTY
+    # Accepted by the constructor and exposed as the raw_data property below
+    raw_data: InitVar[Optional[Dict[str, Any]]] = None
     error: Optional[str] = None
+    _raw: Any = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self, raw_data: Optional[Dict[str, Any]]):
+        self._raw = raw_data
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Response":
-        """Create from backend response."""
-        success = data.get("success", False)
+    def from_dict(cls, data: Dict[str, Any], keep_raw: Optional[bool] = None) -> "Response":
+        """
+        Create from backend response.
         
-        # Parse rounds
-        rounds = [
-            Round.from_dict(round_data) 
-            for round_data in data.get("rounds", [])
-        ]
+        Args:
+            data: The response as returned by the backend
+            keep_raw: Keep data, and each round's data, as raw_data; defaults
+                to the module's KEEP_RAW
+        """
+        if keep_raw is None:
+            keep_raw = KEEP_RAW
+        success = data.get("success", False)
         
-        # Flatten all tools used across all rounds for convenience
+        # Parse rounds, flattening all tools used across them for convenience
+        round_from_dict = Round.from_dict
+        rounds = []
         all_tools = []
-        for round_obj in rounds:
-            all_tools.extend(round_obj.tools_used)
+        # The backend encodes a response without rounds as null
+        for round_data in data.get("rounds") or _EMPTY:
+            round_obj = round_from_dict(round_data, keep_raw)
+            rounds.append(round_obj)
+            # Copied in, so changing the flattened list never touches a round's own list
+            all_tools += round_obj.tools_used
+        
+        # Get the LLM response text. str.strip() returns the string itself
+        # when there is nothing to strip, so it only allocates when needed
+        text = (data.get("llm_response") or "").strip()
         
-        # Get the LLM response text
-        text = data.get("llm_response", "").strip()
+        obj = _reuse_or_new(cls)
         
-        return cls(
-            success=success,
-            text=text,
-            rounds=rounds,
-            tools_used=all_tools,
-            raw_data=data,
-            error=data.get("error")
-        )
+        obj.success = success
+        obj.text = text
+        obj.rounds = rounds or _EMPTY
+        obj.tools_used = all_tools or _EMPTY
+        obj._raw = data if keep_raw else None
+        # Acts that fail inside a batch report their reason as error_message
+        obj.error = data.get("error") or data.get("error_message")
+        return obj
+    
+    @classmethod
+    def from_bytes(cls, buf: bytes, keep_raw: Optional[bool] = None) -> "Response":
+        """
+        Create from an encoded backend response.
+        
+        When the raw data is kept, the response holds on to buf rather than
+        the parsed JSON, which is much smaller, and raw_data decodes it again
+        only if it is read. The rounds' raw_data is not kept in this case.
+        
+        Args:
+            buf: The response body as returned by the backend
+            keep_raw: Keep buf for raw_data; defaults to the module's KEEP_RAW
+        """
+        obj = cls.from_dict(loads(buf), False)
+        if KEEP_RAW if keep_raw is None else keep_raw:
+            obj._raw = bytes(buf)
+        return obj
+    
+    @classmethod
+    def from_many(
+        cls,
+        items: Iterable[Dict[str, Any]],
+        keep_raw: Optional[bool] = None
+    ) -> List["Response"]:
+        """
+        Create responses from many backend responses, e.g. when replaying stored logs.
+        
+        Args:
+            items: The responses as returned by the backend
+            keep_raw: As for from_dict()
+        
+        Returns:
+            One Response per item, in the same order
+        """
+        if keep_raw is None:
+            keep_raw = KEEP_RAW
+        from_dict = cls.from_dict
+        return [from_dict(data, keep_raw) for data in items]
+    
+    def release(self):
+        """
+        Return this response, its rounds and their tool calls to the pools reused by from_dict().
+        
+        Reuse spares the allocator and garbage collector in long-running games.
+        Call it once the response has been handled; none of these objects
+        may be used afterwards, as later responses overwrite them. Responses
+        returned from NPCClient's act cache are shared and must not be released.
+        Releasing a response again does nothing.
+        """
+        if self.rounds is None:  # already released
+            return
+        for round_obj in self.rounds:
+            round_obj.release()
+        self.rounds = self.tools_used = self._raw = None
+        self.text = self.error = None
+        pool = Response._pool
+        if len(pool) < _POOL_SIZE:
+            pool.append(self)
     
     @property
     def llm_response(self) -> str:
         """Alias for text for compatibility."""
         return self.text
 
+
+Round.raw_data = property(_get_raw_data, _set_raw_data)
+Response.raw_data = property(_get_raw_data, _set_raw_data)
@@ -0,0 +1,126 @@
+"""
+msgspec-based response models, decoded straight from JSON bytes.
+
+An optional alternative to the dataclasses in ``models``: ``decode()`` turns
+an ``/npc/act`` response body into typed structs in a single pass, without
+building the intermediate dicts that ``Response.from_dict()`` walks. The
+structs carry the same attributes as their dataclass counterparts, but are
+not pooled and keep no raw data. Requires the ``msgspec`` extra:
+``pip install "llm-npc[msgspec]"``.
+
+Usage:
+    from llm_npc import models_fast
+
+    response = models_fast.decode(body)
+    for tool_call in response.tools_used:
+        print(tool_call.name, tool_call.args)
+"""
+
+import sys
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgspec
+except ImportError as e:
+    raise ImportError(
+        'llm_npc.models_fast requires msgspec; install it with: pip install "llm-npc[msgspec]"'
+    ) from e
+
+
+# The backend encodes empty Go slices and maps as null, so every collection
+# field accepts None and is normalized to empty after decoding
+
+
+class ToolCall(msgspec.Struct):
+    """Represents a tool call made by an NPC."""
+    
+    tool_name: str = ""
+    args: Optional[Dict[str, Any]] = {}
+    success: bool = False
+    response: Optional[str] = None
+    result: Optional[str] = None
+    
+    def __post_init__(self):
+        self.tool_name = sys.intern(self.tool_name)
+        if self.args is None:
+            self.args = {}
+    
+    @property
+    def name(self) -> str:
+        """Alias for tool_name."""
+        return self.tool_name
+
+
+class Round(msgspec.Struct):
+    """Represents a single round of tool execution."""
+    
+    tools_used: Optional[List[ToolCall]] = []
+    
+    def __post_init__(self):
+        if self.tools_used is None:
+            self.tools_used = []
+
+
+class Response(msgspec.Struct):
+    """Represents the response from an NPC action."""
+    
+    success: bool = False
+    text: Optional[str] = msgspec.field(default="", name="llm_response")
+    rounds: Optional[List[Round]] = []
+    # Failed acts report their reason as error_message
+    error: Optional[str] = msgspec.field(default=None, name="error_message")
+    # Not sent by the backend; flattened from rounds after decoding
+    tools_used: List[ToolCall] = []
+    
+    def __post_init__(self):
+        self.text = (self.text or "").strip()
+        if self.rounds is None:
+            self.rounds = []
+        if not self.tools_used:
+            self.tools_used = [tool for round_obj in self.rounds for tool in round_obj.tools_used]
+    
+    @property
+    def llm_response(self) -> str:
+        """Alias for text (backward compatibility)."""
+        return self.text
+
+
+_decoder = msgspec.json.Decoder(Response)
+
+
+class _Batch(msgspec.Struct):
+    """Body of an /npc/act/batch response."""
+    
+    responses: Optional[List[Response]] = []
+
+
+_batch_decoder = msgspec.json.Decoder(_Batch)
+
+
+def decode(buf: bytes) -> Response:
+    """
+    Decode an ``/npc/act`` response body.
+    
+    Args:
+        buf: The JSON response body, as bytes or str
+    
+    Returns:
+        The decoded Response struct
+    
+    Raises:
+        msgspec.ValidationError: If the body does not match the response schema
+    """
+    return _decoder.decode(buf)
+
+
+def decode_many(buf: bytes) -> List[Response]:
+    """
+    Decode an ``/npc/act/batch`` response body.
+    
+    Args:
+        buf: The JSON response body, as bytes or str
+    
+    Returns:
+        One Response struct per action, in the order the backend returned them
+    """
+    return _batch_decoder.decode(buf).responses or []
@@ -0,0 +1,63 @@
+"""Shared fixtures: a stub backend served over HTTP on localhost."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Replies to each path with the (status, JSON body) registered for it.
+    
+    A route may also be a callable taking the parsed request body and
+    returning the (status, JSON body) pair. Bytes bodies are sent as-is, and
+    an optional third item holds extra response headers.
+    """
+    
+    routes = {}
+    requests = []
+    
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        parsed = json.loads(body) if body else None
+        self.requests.append((self.command, self.path, parsed))
+        route = self.routes.get(self.path, (404, {"error": "not found"}))
+        status, payload, *headers = route(parsed) if callable(route) else route
+        reply = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(reply)))
+        for name, value in (headers[0] if headers else {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(reply)
+    
+    do_GET = do_HEAD = do_POST = do_DELETE = _reply
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class StubBackend:
+    """Handle on a running stub backend: its URL, routes and received requests."""
+    
+    def __init__(self, url):
+        self.url = url
+        self.routes = _StubHandler.routes
+        self.requests = _StubHandler.requests
+
+
+@pytest.fixture
+def backend():
+    _StubHandler.routes = {}
+    _StubHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield StubBackend(f"http://127.0.0.1:{server.server_address[1]}")
+    server.shutdown()
+    server.server_close()
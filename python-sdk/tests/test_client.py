@@ -0,0 +1,204 @@
+"""Tests for NPCClient and AsyncNPCClient against a stub backend."""
+
+import asyncio
+
+import pytest
+
+from llm_npc import AsyncNPC, AsyncNPCClient, BackendError, NPC, NPCClient
+
+
+BATCH_RESPONSE = {
+    "responses": [
+        {"npc_id": "npc-1", "success": True, "llm_response": "Halt!", "rounds": []},
+        {"npc_id": "npc-2", "success": False, "error_message": "NPC not found"},
+    ]
+}
+
+
+def test_act_batch_keeps_error_message_of_failed_entry(backend):
+    pytest.importorskip("requests")
+    backend.routes["/npc/act/batch"] = (200, BATCH_RESPONSE)
+    
+    with NPCClient(backend.url) as client:
+        session = client.session("game")
+        guard = NPC(client, session, "npc-1", "Guard", "A vigilant guard")
+        ghost = NPC(client, session, "npc-2", "Ghost", "Deleted already")
+        responses = session.act_batch([(guard, ["Gate"], None, None), (ghost, ["Crypt"], None, None)])
+    
+    assert responses[0].success and responses[0].error is None
+    assert not responses[1].success
+    assert responses[1].error == "NPC not found"
+
+
+def test_async_act_batch_keeps_error_message_of_failed_entry(backend):
+    pytest.importorskip("httpx")
+    backend.routes["/npc/act/batch"] = (200, BATCH_RESPONSE)
+    
+    async def run():
+        async with AsyncNPCClient(backend.url, http2=False) as client:
+            session = client.session("game")
+            guard = AsyncNPC(client, session, "npc-1", "Guard", "A vigilant guard")
+            ghost = AsyncNPC(client, session, "npc-2", "Ghost", "Deleted already")
+            return await session.act_batch([(guard, ["Gate"], None, None), (ghost, ["Crypt"], None, None)])
+    
+    responses = asyncio.run(run())
+    
+    assert responses[1].error == "NPC not found"
+
+
+ACT_RESPONSE = {"npc_id": "npc-1", "success": True, "llm_response": "Halt!", "rounds": []}
+
+
+def test_async_npc_act_async_returns_task(backend):
+    pytest.importorskip("httpx")
+    backend.routes["/npc/act"] = (200, ACT_RESPONSE)
+    
+    async def run():
+        async with AsyncNPCClient(backend.url, http2=False) as client:
+            guard = AsyncNPC(client, client.session("game"), "npc-1", "Guard", "A vigilant guard")
+            surroundings = ["Gate"]
+            task = guard.act_async(surroundings)
+            surroundings.append("Moat")  # the request was encoded before act_async returned
+            return await task
+    
+    response = asyncio.run(run())
+    
+    assert response.text == "Halt!"
+    assert backend.requests[0][2]["surroundings"] == [{"name": "Gate", "description": "Gate"}]
+
+
+def test_async_npc_act_accepts_cache_like_npc_act(backend):
+    pytest.importorskip("httpx")
+    backend.routes["/npc/act"] = (200, ACT_RESPONSE)
+    
+    async def run():
+        async with AsyncNPCClient(backend.url, http2=False) as client:
+            guard = AsyncNPC(client, client.session("game"), "npc-1", "Guard", "A vigilant guard")
+            first = await guard.act(["Gate"], cache=False)
+            second = await guard.act_async(["Gate"], cache=False)
+            return first, second
+    
+    first, second = asyncio.run(run())
+    
+    assert first.text == second.text == "Halt!"
+    assert len(backend.requests) == 2
+
+
+def test_act_is_not_retried_on_gateway_timeout(backend):
+    pytest.importorskip("requests")
+    backend.routes["/npc/act"] = (504, {"error": "LLM request timed out"})
+    
+    with NPCClient(backend.url) as client:
+        guard = NPC(client, client.session("game"), "npc-1", "Guard", "A vigilant guard")
+        with pytest.raises(BackendError):
+            guard.act(["Gate"])
+    
+    assert [path for _, path, _ in backend.requests] == ["/npc/act"]
+
+
+def _reply_per_act(body):
+    """Answer a batch with one response per act, echoing its npc_id."""
+    if len(body["acts"]) > 64:
+        return 413, {"error": "too many acts"}
+    return 200, {"responses": [{"npc_id": act["npc_id"], "success": True} for act in body["acts"]]}
+
+
+def test_act_batch_splits_batches_over_backend_limit(backend):
+    pytest.importorskip("requests")
+    backend.routes["/npc/act/batch"] = _reply_per_act
+    
+    with NPCClient(backend.url) as client:
+        session = client.session("game")
+        npcs = [NPC(client, session, f"npc-{i}", "Villager", "A villager") for i in range(130)]
+        responses = session.act_batch([(npc, ["Square"], None, None) for npc in npcs])
+    
+    assert [len(body["acts"]) for _, _, body in backend.requests] == [64, 64, 2]
+    assert len(responses) == 130 and all(response.success for response in responses)
+
+
+def test_async_act_batch_splits_batches_over_backend_limit(backend):
+    pytest.importorskip("httpx")
+    backend.routes["/npc/act/batch"] = _reply_per_act
+    
+    async def run():
+        async with AsyncNPCClient(backend.url, http2=False) as client:
+            session = client.session("game")
+            npcs = [AsyncNPC(client, session, f"npc-{i}", "Villager", "A villager") for i in range(65)]
+            return await session.act_batch([(npc, ["Square"], None, None) for npc in npcs])
+    
+    responses = asyncio.run(run())
+    
+    assert sorted(len(body["acts"]) for _, _, body in backend.requests) == [1, 64]
+    assert len(responses) == 65 and all(response.success for response in responses)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"<html>Bad gateway</html>", b'{"success": true, "rounds": [' + b" " * 70000],
+    ids=["html", "truncated-streamed"]
+)
+def test_invalid_response_body_raises_backend_error(backend, body):
+    pytest.importorskip("requests")
+    for path in ("/npc/list", "/npc/register", "/npc/act", "/npc/act/batch"):
+        backend.routes[path] = (200, body)
+    
+    with NPCClient(backend.url) as client:
+        session = client.session("game")
+        guard = NPC(client, session, "npc-1", "Guard", "A vigilant guard")
+        
+        with pytest.raises(BackendError):
+            client.list_npcs()
+        with pytest.raises(BackendError):
+            session.create_npc("Guard", "A vigilant guard")
+        with pytest.raises(BackendError):
+            guard.act(["Gate"], cache=False)
+        with pytest.raises(BackendError):
+            session.act_batch([(guard, ["Gate"], None, None)])
+
+
+def test_async_invalid_response_body_raises_backend_error(backend):
+    pytest.importorskip("httpx")
+    for path in ("/npc/list", "/npc/register", "/npc/act", "/npc/act/batch"):
+        backend.routes[path] = (200, b"<html>Bad gateway</html>")
+    
+    async def run():
+        async with AsyncNPCClient(backend.url, http2=False) as client:
+            session = client.session("game")
+            guard = AsyncNPC(client, session, "npc-1", "Guard", "A vigilant guard")
+            
+            with pytest.raises(BackendError):
+                await client.list_npcs()
+            with pytest.raises(BackendError):
+                await session.create_npc("Guard", "A vigilant guard")
+            with pytest.raises(BackendError):
+                await guard.act(["Gate"])
+            with pytest.raises(BackendError):
+                await session.act_batch([(guard, ["Gate"], None, None)])
+    
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("route, healthy, methods", [
+    ((200, b"pong", {"X-Health": "pong"}), True, ["HEAD"]),
+    ((200, b"pong"), True, ["HEAD", "GET"]),
+    ((200, b"<html>Welcome to nginx!</html>"), False, ["HEAD", "GET"]),
+], ids=["pong-header", "pong-body", "other-server"])
+def test_health_check_requires_pong(backend, route, healthy, methods):
+    pytest.importorskip("requests")
+    backend.routes["/health"] = route
+    
+    with NPCClient(backend.url) as client:
+        assert client.health_check() is healthy
+    
+    assert [method for method, _, _ in backend.requests] == methods
+
+
+def test_async_health_check_requires_pong(backend):
+    pytest.importorskip("httpx")
+    backend.routes["/health"] = (200, b"<html>Welcome to nginx!</html>")
+    
+    async def run():
+        async with AsyncNPCClient(backend.url, http2=False) as client:
+            return await client.health_check()
+    
+    assert asyncio.run(run()) is False
@@ -0,0 +1,115 @@
+"""Tests for the @tool decorator."""
+
+from typing import Dict, List, Optional
+
+import pytest
+
+from llm_npc import tool
+from llm_npc.decorators import _parse_args_section
+
+
+def _reference_parse(docstring):
+    """The original line-by-line Args parser, kept as the reference for parity."""
+    descriptions = {}
+    lines = docstring.split('\n')
+    
+    in_args_section = False
+    for line in lines:
+        stripped = line.strip()
+        
+        if stripped.lower().startswith('args:') or stripped.lower().startswith('parameters:'):
+            in_args_section = True
+            continue
+        
+        if in_args_section:
+            if stripped and not stripped[0].isspace() and ':' in stripped and stripped[0].isupper():
+                break
+            
+            if ':' in stripped:
+                parts = stripped.split(':', 1)
+                param_part = parts[0].strip()
+                desc_part = parts[1].strip() if len(parts) > 1 else ""
+                
+                if '(' in param_part:
+                    param_part = param_part.split('(')[0].strip()
+                
+                if param_part:
+                    descriptions[param_part] = desc_part
+    
+    return descriptions
+
+
+DOCSTRINGS = [
+    # Indented entries after a summary line
+    "Make the NPC speak.\n\nArgs:\n    message: What to say\n    target (str): Who to address\n\nReturns:\n    Nothing",
+    # Heading on the first line, dedented by inspect.getdoc()
+    "Args:\na: x\nb: y",
+    # Entries flush with the heading
+    "Move somewhere.\n\nArgs:\nx: Column\ny: Row",
+    # "Parameters:" heading and a blank line inside the section
+    "Attack.\n\nParameters:\n    target: Who to hit\n\n    damage: How hard",
+    # Continuation lines and a trailing section
+    "Give.\n\nArgs:\n    item: The item\n        to hand over\n    amount: How many\nRaises:\n    ValueError: never",
+    # No Args section
+    "Just a summary.",
+    "",
+]
+
+
+@pytest.mark.parametrize("docstring", DOCSTRINGS)
+def test_parse_args_section_matches_reference(docstring):
+    assert _parse_args_section(docstring) == _reference_parse(docstring)
+
+
+def test_tool_reads_descriptions_from_heading_first_docstring():
+    @tool
+    def wave(a: str, b: str):
+        """Args:
+            a: x
+            b: y"""
+    
+    params = wave._tool_metadata["parameters"]
+    assert params["a"]["description"] == "x"
+    assert params["b"]["description"] == "y"
+
+
+def test_parse_args_section_reads_unindented_entries():
+    assert _parse_args_section("Move.\n\nArgs:\nx: Column\ny: Row") == {"x": "Column", "y": "Row"}
+
+
+def test_tool_maps_type_hints_to_backend_types():
+    @tool
+    def trade(
+        item: str,
+        count: int,
+        price: float,
+        haggle: bool,
+        offer: Dict[str, int],
+        extras: List[str],
+        note: Optional[int] = None,
+        mood=None,
+    ):
+        """Trade with a merchant."""
+    
+    params = trade._tool_metadata["parameters"]
+    assert {name: param["type"] for name, param in params.items()} == {
+        "item": "string",
+        "count": "number",
+        "price": "number",
+        "haggle": "boolean",
+        "offer": "object",
+        "extras": "array",
+        "note": "number",
+        "mood": "string",
+    }
+    assert params["count"]["required"] and not params["note"]["required"]
+
+
+def test_tool_maps_unresolvable_string_annotations():
+    @tool
+    def follow(target: "Npc", steps: "int"):
+        """Follow someone."""
+    
+    params = follow._tool_metadata["parameters"]
+    assert params["target"]["type"] == "string"
+    assert params["steps"]["type"] == "number"
@@ -0,0 +1,68 @@
+"""Tests for the response models."""
+
+import pytest
+
+from llm_npc.models import Response, Round, ToolCall
+
+
+def test_from_dict_reads_error_message():
+    response = Response.from_dict({"success": False, "error_message": "NPC not found"})
+    
+    assert response.error == "NPC not found"
+
+
+def test_models_fast_reads_error_message():
+    models_fast = pytest.importorskip("llm_npc.models_fast")
+    
+    response = models_fast.decode(b'{"success": false, "error_message": "NPC not found"}')
+    
+    assert response.error == "NPC not found"
+
+
+def test_tool_calls_without_args_do_not_share_a_dict():
+    first = ToolCall.from_dict({"tool_name": "wait", "args": None, "success": True})
+    second = ToolCall.from_dict({"tool_name": "wait", "success": True})
+    
+    first.args["seconds"] = 5
+    
+    assert second.args == {}
+    assert ToolCall.from_dict({"tool_name": "wait", "args": None, "success": True}).args == {}
+
+
+def test_tools_used_does_not_alias_round_lists():
+    response = Response.from_dict({
+        "success": True,
+        "rounds": [
+            {"tools_used": [{"tool_name": "speak", "args": {}, "success": True}]},
+            {"tools_used": []},
+        ],
+    })
+    
+    response.tools_used.append(ToolCall("wave", {}, True))
+    
+    assert len(response.rounds[0].tools_used) == 1
+    assert len(response.tools_used) == 2
+
+
+def test_release_twice_pools_each_object_once():
+    response = Response.from_dict({
+        "success": True,
+        "rounds": [{"tools_used": [{"tool_name": "speak", "args": {}, "success": True}]}],
+    })
+    tool_call = response.tools_used[0]
+    round_obj = response.rounds[0]
+    
+    response.release()
+    response.release()
+    round_obj.release()
+    tool_call.release()
+    
+    assert [obj for obj in ToolCall._pool if obj is tool_call] == [tool_call]
+    assert [obj for obj in Round._pool if obj is round_obj] == [round_obj]
+    assert [obj for obj in Response._pool if obj is response] == [response]
+    
+    # Reused from the pool, it can be released again
+    reused = ToolCall.from_dict({"tool_name": "wave", "args": {}, "success": True})
+    assert reused is tool_call
+    reused.release()
+    assert [obj for obj in ToolCall._pool if obj is reused] == [reused]